@@ -1,2 +1,3 @@
 from .onion_decomposition import *
-from .clustering_spectrum import *
\ No newline at end of file
+from .clustering_spectrum import *
+from .batch import *
\ No newline at end of file
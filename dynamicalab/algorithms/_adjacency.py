@@ -0,0 +1,29 @@
+import networkx as nx
+import numpy as np
+import scipy.sparse
+
+
+def _simple_adjacency(graph):
+    """Returns the nodes and the ``scipy.sparse.csr_matrix`` adjacency of the simple undirected
+    version of ``graph``, a networkx graph or a scipy.sparse adjacency matrix: the edges are
+    symmetrized, and the self-loops and multiedges removed.
+    """
+    if scipy.sparse.issparse(graph):
+        nodes = list(range(graph.shape[0]))
+        A = scipy.sparse.csr_matrix(graph)
+    else:
+        nodes = list(graph.nodes())
+        if not nodes:
+            return nodes, scipy.sparse.csr_matrix((0, 0), dtype=np.int8)
+        try:
+            A = nx.to_scipy_sparse_array(graph, nodelist=nodes, weight=None, format="csr")
+        except AttributeError:
+            A = nx.to_scipy_sparse_matrix(graph, nodelist=nodes, weight=None, format="csr")
+        A = scipy.sparse.csr_matrix(A)
+
+    A = (A != 0).astype(np.int8)
+    A = (A + A.T).tocsr()
+    A.setdiag(0)
+    A.eliminate_zeros()
+    A.data[:] = 1
+    return nodes, A
@@ -0,0 +1,145 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from ..classes.Dataset import Dataset
+from ..classes._registry import registry
+from .clustering_spectrum import clustering_spectrum
+from .onion_decomposition import onion_decomposition
+
+__all__ = [
+    'batch_analysis',
+]
+
+# Algorithms that can be given by name.
+ALGORITHMS = {
+    "onion_decomposition": onion_decomposition,
+    "clustering_spectrum": clustering_spectrum,
+}
+
+
+def _algorithm_name(algorithm):
+    # functools.partial objects are named after the function they wrap.
+    algorithm = getattr(algorithm, "func", algorithm)
+    return getattr(algorithm, "__name__", repr(algorithm))
+
+
+def _resolve_algorithms(algorithms):
+    """Returns the list of ``(name, callable)``, the names being looked up in ``ALGORITHMS``."""
+    items = algorithms.items() if isinstance(algorithms, dict) else ((None, a) for a in algorithms)
+    resolved = []
+    for name, algorithm in items:
+        if isinstance(algorithm, str):
+            if algorithm not in ALGORITHMS:
+                raise ValueError("Unknown algorithm {}.".format(algorithm))
+            name, algorithm = name or algorithm, ALGORITHMS[algorithm]
+        resolved.append((name or _algorithm_name(algorithm), algorithm))
+    return resolved
+
+
+def _resolve_datasets(datasets, save_path):
+    """Returns the list of ``Dataset``, the strings being names or collections of the registry."""
+    if isinstance(datasets, (str, Dataset)):
+        datasets = [datasets]
+    resolved = []
+    for dataset in datasets:
+        if isinstance(dataset, Dataset):
+            resolved.append(dataset)
+        elif dataset in registry:
+            resolved.append(registry.dataset(dataset, save_path))
+        elif dataset in registry.collections():
+            resolved.extend(registry.datasets(save_path, collection=dataset))
+        else:
+            raise ValueError("Unknown dataset or collection {}.".format(dataset))
+    return resolved
+
+
+def _run_dataset(dataset, algorithms, use_cache):
+    """Loads the graph of ``dataset`` once and runs every algorithm on it. Errors are reported in the rows."""
+    label = dataset.name or dataset.data_name
+    start = time.perf_counter()
+    try:
+        G = dataset.graph(use_cache=use_cache)
+    except Exception as error:
+        load_seconds = time.perf_counter() - start
+        return [{"dataset": label, "algorithm": name, "result": None, "seconds": None,
+                 "load_seconds": load_seconds, "error": repr(error)} for name, _ in algorithms]
+    load_seconds = time.perf_counter() - start
+
+    rows = []
+    for name, algorithm in algorithms:
+        start = time.perf_counter()
+        try:
+            result, error = algorithm(G), None
+        except Exception as exception:
+            result, error = None, repr(exception)
+        rows.append({"dataset": label, "algorithm": name, "result": result, "seconds": time.perf_counter() - start,
+                     "load_seconds": load_seconds, "error": error})
+    return rows
+
+
+def batch_analysis(datasets, algorithms, max_workers=None, save_path="./data", use_cache=True):
+    """Runs a list of algorithms on a collection of datasets in a pool of processes.
+
+    Each dataset is a task: its graph is loaded once, from the disk cache when it is available,
+    and every algorithm is run on it in the same process. The results are gathered in a tidy
+    table, one row per dataset and algorithm, in the order of the inputs. An error raised by a
+    dataset or an algorithm is reported in its rows and does not stop the other tasks.
+
+    **Parameters**
+
+    datasets : iterable of Dataset or String
+        Datasets to analyze, for instance ``dlb.food_webs("./data")``. A string is the name of a
+        dataset or of a collection of the registry, such as ``"plants_pollinators"``.
+
+    algorithms : list or dict
+        Functions called as ``algorithm(G)``, or the names ``"onion_decomposition"`` and
+        ``"clustering_spectrum"``. A dictionary maps the name of each algorithm in the
+        table to the function. The functions are sent to the workers, so they must be defined at the
+        top level of a module; use ``functools.partial`` to fix their parameters.
+
+    max_workers : int : (default=None)
+        Number of processes. If None, the number of processors is used.
+
+    save_path : String : (default="./data")
+        Directory of the datasets given by name.
+
+    use_cache : bool : (default=True)
+        Passed to ``Dataset.graph``.
+
+    **Returns**
+
+    list of dict
+        One row per dataset and algorithm with the keys ``dataset``, ``algorithm``, ``result``,
+        ``seconds`` (run time of the algorithm), ``load_seconds`` (time to load the graph) and
+        ``error`` (``None``, or the representation of the exception). It can be passed directly
+        to ``pandas.DataFrame``.
+
+    **Raise**
+
+        ``ValueError``
+            Occurs if a dataset, a collection or an algorithm name is unknown.
+
+    **Example**
+
+    .. code:: python
+
+        import itertools
+        import dynamicalab as dlb
+        import dynamicalab.algorithms as algo
+
+        datasets = itertools.chain(dlb.plants_pollinators("./data"), dlb.food_webs("./data"))
+        rows = algo.batch_analysis(datasets, ["onion_decomposition", "clustering_spectrum"], max_workers=8)
+        for row in rows:
+            print(row["dataset"], row["algorithm"], row["seconds"], row["error"])
+
+    """
+    algorithms = _resolve_algorithms(algorithms)
+    datasets = _resolve_datasets(datasets, save_path)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_run_dataset, dataset, algorithms, use_cache) for dataset in datasets]
+        try:
+            return [row for future in futures for row in future.result()]
+        finally:
+            for future in futures:
+                future.cancel()
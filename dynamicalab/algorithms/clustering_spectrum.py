@@ -1,18 +1,49 @@
-import networkx as nx
 import numpy as np
+import scipy.sparse
+import scipy.stats
 
-def clustering_spectrum(g):
+from ._adjacency import _simple_adjacency
+from ..utils.rng import make_rng
+
+__all__ = [
+    'clustering_spectrum',
+]
+
+def clustering_spectrum(g, approximate=False, n_samples=None, epsilon=0.01, confidence=0.95, seed=None):
     """This function extracts the clustering spectrum of a simple undirected graph. 
       
     **Parameters**
     
-    g : nx.Graph
-        A simple undirected graph without self-loops.
+    g : nx.Graph or scipy.sparse matrix
+        A simple undirected graph without self-loops, or its adjacency matrix.
+
+    approximate : bool : (default=False)
+        If True, the average clustering of each degree class is estimated by sampling wedges
+        (pairs of neighbors of a node) instead of counting all the triangles.
+
+    n_samples : int : (default=None)
+        Number of wedges sampled in each degree class if ``approximate``. If None, it is chosen from
+        ``epsilon`` with the Hoeffding bound, ``log(2/(1-confidence))/(2 epsilon^2)``. The cost does not
+        depend on the size of the graph once its adjacency matrix is built.
+
+    epsilon : float : (default=0.01)
+        Target error of each estimate, used if ``n_samples`` is None.
+
+    confidence : float : (default=0.95)
+        Level of the confidence intervals.
+
+    seed : int, np.random.SeedSequence or np.random.Generator : (default=None)
+        Seed of the random number generator used if ``approximate``.
     
     
     .. warning::
 
       The graph must be **simple** (no multiedges), **undirected** and **without self-loops**.
+
+    .. note::
+
+      The triangles of all the nodes are counted at once with sparse matrix products, after orienting
+      each edge towards the node of higher degree, and the degree classes are averaged with ``np.bincount``.
     
 
     **Returns**
@@ -20,6 +51,10 @@ def clustering_spectrum(g):
     clust_spect : dict
         Dictionary mapping each degree class (integers) to the corresponding average local clustering coefficient (float).
 
+    intervals : dict
+        Only if ``approximate``. Dictionary mapping each degree class to the ``(lower, upper)`` bounds of the
+        Wilson confidence interval of its estimate.
+
 
     **Example**
     
@@ -52,14 +87,95 @@ def clustering_spectrum(g):
 
     """
     # Gets the degree and the local clustering coefficient of each node.
-    deg = g.degree()
-    clu = nx.clustering(g)
-    # Puts them in a list preserving the order.
-    d = [deg[n] for n in g.nodes()]
-    c = [clu[n] for n in g.nodes()]
+    _, A = _simple_adjacency(g)
+    d = np.asarray(A.sum(axis=1)).ravel().astype(np.int64)
+    if approximate:
+        if n_samples is None:
+            n_samples = int(np.ceil(np.log(2 / (1 - confidence)) / (2 * epsilon**2)))
+        if n_samples < 1:
+            raise ValueError("n_samples must be a positive integer.")
+        return _sampled_spectrum(A, d, n_samples, confidence, make_rng(seed))
+    c = _local_clustering(A, d)
     # Returns a dictionary mapping each degree class to the corresponding average local
     #   clustering coefficient.
-    return {k : x / n for x,k,n in zip(
-                 np.histogram(d, bins=np.arange(0.5, np.max(d)+1.5, 1), weights=c)[0],
-                 np.arange(1, np.max(d)+2, 1),
-                 np.histogram(d, bins=np.arange(0.5, np.max(d)+1.5, 1))[0]) if n > 0}
\ No newline at end of file
+    n = np.bincount(d)
+    x = np.bincount(d, weights=c)
+    return {k : x[k] / n[k] for k in range(1, len(n)) if n[k] > 0}
+
+
+def _triangles(A, d):
+    """Number of triangles of each node of the simple undirected graph of adjacency ``A``.
+
+    Each edge is oriented from the node of lower degree to the node of higher degree,
+    which bounds the out-degrees by sqrt(2M). Every triangle ``u -> v -> w`` with
+    ``u -> w`` then appears once in ``S = (L @ L) * L``, at ``(u, w)`` through ``v``.
+    """
+    N = A.shape[0]
+    rank = np.empty(N, dtype=np.int64)
+    rank[np.lexsort((np.arange(N), d))] = np.arange(N)
+    A = A.tocoo()
+    upper = rank[A.row] < rank[A.col]
+    L = scipy.sparse.csr_matrix((np.ones(upper.sum(), dtype=np.int64), (A.row[upper], A.col[upper])), shape=(N, N))
+
+    S = (L @ L).multiply(L)
+    M = (L.T @ L).multiply(L)
+    return (np.asarray(S.sum(axis=1)).ravel() + np.asarray(S.sum(axis=0)).ravel()
+            + np.asarray(M.sum(axis=1)).ravel())
+
+
+def _local_clustering(A, d):
+    """Local clustering coefficient of each node, 0 for the nodes of degree lower than 2."""
+    t = _triangles(A, d)
+    c = np.zeros(len(d))
+    has_pairs = d > 1
+    c[has_pairs] = 2*t[has_pairs] / (d[has_pairs]*(d[has_pairs] - 1))
+    return c
+
+
+def _sampled_spectrum(A, d, n_samples, confidence, rng):
+    """Estimates the clustering spectrum from ``n_samples`` wedges per degree class.
+
+    A wedge is drawn by picking a node of the class uniformly, then two of its distinct neighbors.
+    The probability that the wedge is closed is the average local clustering of the class.
+    """
+    A.sort_indices()
+    N = A.shape[0]
+    n = np.bincount(d)
+    classes = np.flatnonzero(n)
+    classes = classes[classes > 0]
+
+    # Nodes sorted by degree, such that each class is a contiguous block.
+    order = np.argsort(d, kind="stable")
+    starts = np.concatenate([[0], np.cumsum(n)])[classes]
+    wedge_classes = classes[classes > 1]
+    k = np.repeat(wedge_classes, n_samples)
+    nodes = order[np.repeat(starts[classes > 1], n_samples) + (rng.random(len(k)) * np.repeat(n[wedge_classes], n_samples)).astype(np.int64)]
+
+    # Two distinct neighbors of each node.
+    i = rng.integers(0, k)
+    j = rng.integers(0, k - 1)
+    j += j >= i
+    a = A.indices[A.indptr[nodes] + i].astype(np.int64)
+    b = A.indices[A.indptr[nodes] + j].astype(np.int64)
+
+    # The edge (a, b) exists if its key is found among the sorted keys of the CSR matrix.
+    keys = np.repeat(np.arange(N, dtype=np.int64), np.diff(A.indptr)) * N + A.indices
+    queries = a * N + b
+    found = keys[np.minimum(np.searchsorted(keys, queries), len(keys) - 1)] == queries
+    p = found.reshape((-1, n_samples)).mean(axis=1)
+
+    # Wilson score interval.
+    z = scipy.stats.norm.ppf(0.5 + confidence / 2)
+    center = (p + z**2 / (2 * n_samples)) / (1 + z**2 / n_samples)
+    half_width = z * np.sqrt(p * (1 - p) / n_samples + z**2 / (4 * n_samples**2)) / (1 + z**2 / n_samples)
+
+    clust_spect = {}
+    intervals = {}
+    # The nodes of degree 1 have no wedge, their clustering is 0.
+    if n.size > 1 and n[1] > 0:
+        clust_spect[1] = 0.0
+        intervals[1] = (0.0, 0.0)
+    for index, k in enumerate(wedge_classes.tolist()):
+        clust_spect[k] = float(p[index])
+        intervals[k] = (float(max(center[index] - half_width[index], 0)), float(min(center[index] + half_width[index], 1)))
+    return clust_spect, intervals
@@ -1,5 +1,15 @@
+import heapq
+import itertools
+
 import networkx as nx
 
+from ._adjacency import _simple_adjacency
+
+__all__ = [
+    'onion_decomposition',
+    'OnionDecomposition',
+]
+
 def onion_decomposition(graph):
     """This function extracts the onion decomposition and the k-core decomposition of a simple undirected graph. 
       
@@ -7,13 +17,18 @@ def onion_decomposition(graph):
       **Parameters**
       
     
-      graph : nx.Graph
-          A simple undirected graph without self-loops.
+      graph : nx.Graph or scipy.sparse matrix
+          A simple undirected graph without self-loops, or its adjacency matrix.
       
       
       .. warning::
 
         The algorithm only considers the **simple** (no multiedges), **undirected** and **without self-loops** version of the original graph.
+
+      .. note::
+
+        The vertices are peeled with the bucket queue of Batagelj and Zaversnik over the CSR arrays of the adjacency matrix,
+        in O(N+M) time. The input graph is neither copied nor modified.
       
 
       **Retuns**
@@ -44,31 +59,383 @@ def onion_decomposition(graph):
       
 
     """
-    # Creates a copy of the graph (to be able to remove vertices and edges) and .
-    _the_graph = nx.Graph(graph).to_undirected()
-    _the_graph.remove_edges_from( _the_graph.selfloop_edges() )
-    # Dictionaries to register the k-core/onion decompositions. 
-    _coreness_map = {}
-    _layer_map = {}
-    # Performs the onion decomposition.
+    nodes, A = _simple_adjacency(graph)
+    indptr, indices = A.indptr.tolist(), A.indices.tolist()
+    N = len(nodes)
+    degree = [indptr[v + 1] - indptr[v] for v in range(N)]
+    max_degree = max(degree, default=0)
+
+    # Bucket sort of the vertices by degree (Batagelj and Zaversnik, 2003): vertices[bins[d]:bins[d+1]]
+    # holds the remaining vertices of degree d, and position is the inverse permutation of vertices.
+    bins = [0]*(max_degree + 2)
+    for d in degree:
+        bins[d + 1] += 1
+    for d in range(max_degree + 1):
+        bins[d + 1] += bins[d]
+    vertices = [0]*N
+    position = [0]*N
+    fill = bins[:]
+    for v in range(N):
+        position[v] = fill[degree[v]]
+        vertices[position[v]] = v
+        fill[degree[v]] += 1
+
+    coreness = [0]*N
+    layer = [0]*N
     _current_core = 1
     _current_layer = 1
-    while _the_graph.number_of_nodes() > 0:
-        # Sets properly the current core.
-        _min_degree =  min([d for n, d in _the_graph.degree()])
+    start = 0
+    while start < N:
+        # The remaining vertex of smallest degree is the first one of the sorted array.
+        _min_degree = degree[vertices[start]]
         if _min_degree >= (_current_core+1):
             _current_core = _min_degree
-        # Identifies vertices in the current layer.
-        _this_layer_ = []
-        for v in _the_graph.nodes():
-            if _the_graph.degree()[v] <= _current_core:
-                _this_layer_.append(v)
-        # Identifies the core/layer of the vertices in the current layer.
-        for v in _this_layer_:
-            _coreness_map[v] = _current_core
-            _layer_map[v] = _current_layer
-            _the_graph.remove_node(v)
-        # Updates the layer count.
+        # The current layer is the prefix of the vertices of degree <= _current_core.
+        end = bins[_current_core + 1] if _current_core + 1 < len(bins) else N
+        for v in vertices[start:end]:
+            coreness[v] = _current_core
+            layer[v] = _current_layer
+        # Removes the layer: each remaining neighbor of higher degree moves to the start of its bin.
+        for v in vertices[start:end]:
+            for u in indices[indptr[v]:indptr[v + 1]]:
+                d = degree[u]
+                if d > _current_core:
+                    w = vertices[bins[d]]
+                    if u != w:
+                        vertices[position[u]], vertices[bins[d]] = w, u
+                        position[w], position[u] = position[u], bins[d]
+                    bins[d] += 1
+                    degree[u] = d - 1
+        start = end
         _current_layer = _current_layer + 1
+
     # Returns the dictionaries containing the k-shell and onion layer of each vertices.
-    return (_layer_map, _coreness_map)
+    return dict(zip(nodes, layer)), dict(zip(nodes, coreness))
+
+
+
+class OnionDecomposition(object):
+    """Onion decomposition and k-core decomposition of an evolving simple undirected graph.
+
+    The coreness and the onion layers are kept up to date when edges are added or removed.
+    After an update, the coreness changes by at most one, only for vertices of the same coreness
+    as the endpoints and connected to them [1]. They are found by a traversal from the endpoints
+    pruned by the number of neighbors in the k-core. In the k-shells touched by the update, the onion
+    layers are then peeled again only for the vertices whose neighborhood changed, and for the neighbors
+    of the vertices whose layer changed; the layers of the other shells are shifted by an offset.
+
+    The results are the same as ``onion_decomposition`` on the current graph, including its convention
+    that the coreness starts at 1.
+
+    **Parameters**
+
+    graph : nx.Graph : (default=None)
+        Initial graph. Only its **simple**, **undirected** and **without self-loops** version is considered.
+
+    **References**
+
+    ..
+
+      [1] A. E. Sarıyüce, B. Gedik, G. Jacques-Silva, K.-L. Wu and Ü. V. Çatalyürek, Streaming algorithms for k-core decomposition. `Proceedings of the VLDB Endowment 6, 433 (2013) <https://doi.org/10.14778/2536336.2536344>`_
+
+    **Example**
+
+    .. code:: python
+
+      import networkx as nx
+      import dynamicalab.algorithms as algo
+
+      G = nx.florentine_families_graph()
+      decomposition = algo.OnionDecomposition(G)
+      decomposition.add_edge("Medici", "Strozzi")
+      decomposition.remove_edge("Medici", "Acciaiuoli")
+      onion, kcore = decomposition.decomposition()
+
+    """
+    def __init__(self, graph=None):
+        # Adjacency sets, coreness (0 for the isolated vertices) and layer within the k-shell.
+        self._adjacency = {}
+        self._core = {}
+        self._local_layer = {}
+        # Vertices and number of vertices in each layer of the k-shells, with the coreness starting at 1.
+        self._shells = {}
+        self._layer_sizes = {}
+        self._offsets = None
+        if graph is None:
+            return
+
+        for v in graph.nodes():
+            self._adjacency[v] = set()
+        for u, v in graph.edges():
+            if u != v:
+                self._adjacency[u].add(v)
+                self._adjacency[v].add(u)
+
+        layers, coreness = onion_decomposition(graph)
+        first_layer = {}
+        for v, k in coreness.items():
+            self._core[v] = k if self._adjacency[v] else 0
+            self._shells.setdefault(k, set()).add(v)
+            first_layer[k] = min(first_layer.get(k, layers[v]), layers[v])
+        for v, k in coreness.items():
+            self._local_layer[v] = layers[v] - first_layer[k] + 1
+            self._count_layer(k, self._local_layer[v], 1)
+
+    def __len__(self):
+        return len(self._adjacency)
+
+    def __contains__(self, v):
+        return v in self._adjacency
+
+    def coreness(self):
+        """Returns the dictionary mapping the vertices to the maximal k-core to which they belong."""
+        return {v: max(1, k) for v, k in self._core.items()}
+
+    def layers(self):
+        """Returns the dictionary mapping the vertices to their layer in the onion decomposition."""
+        offsets = self._layer_offsets()
+        return {v: offsets[max(1, k)] + self._local_layer[v] for v, k in self._core.items()}
+
+    def decomposition(self):
+        """Returns ``(onion, kcore)``, as ``onion_decomposition``."""
+        return self.layers(), self.coreness()
+
+    def add_node(self, v):
+        """Adds the isolated vertex ``v``, which lies in the first layer."""
+        if v in self._adjacency:
+            return
+        self._adjacency[v] = set()
+        self._core[v] = 0
+        self._shells.setdefault(1, set()).add(v)
+        self._local_layer[v] = 1
+        self._count_layer(1, 1, 1)
+        self._offsets = None
+
+    def remove_node(self, v):
+        """Removes the vertex ``v`` and its edges."""
+        for u in list(self._adjacency[v]):
+            self.remove_edge(u, v)
+        # The vertex is now isolated, in the first layer of the 1-shell, and removing it changes no other layer.
+        self._shells[1].discard(v)
+        self._count_layer(1, 1, -1)
+        del self._adjacency[v], self._core[v], self._local_layer[v]
+        if not self._shells[1]:
+            del self._shells[1]
+        self._offsets = None
+
+    def add_edge(self, u, v):
+        """Adds the edge ``(u, v)`` and its vertices, and updates the decomposition. Self-loops and existing edges are ignored."""
+        self.add_node(u)
+        self.add_node(v)
+        if u == v or v in self._adjacency[u]:
+            return
+        self._adjacency[u].add(v)
+        self._adjacency[v].add(u)
+
+        # Only the vertices of coreness K connected to the root through vertices with more than K
+        # neighbors in the K-core can reach the (K+1)-core.
+        K = min(self._core[u], self._core[v])
+        candidates = set()
+        stack = [w for w in (u, v) if self._core[w] == K and self._core_degree(w, K) > K]
+        candidates.update(stack)
+        while stack:
+            w = stack.pop()
+            for x in self._adjacency[w]:
+                if self._core[x] == K and x not in candidates and self._core_degree(x, K) > K:
+                    candidates.add(x)
+                    stack.append(x)
+
+        # Candidates without more than K neighbors among the candidates and the (K+1)-core are evicted.
+        degree = {w: sum(1 for x in self._adjacency[w] if self._core[x] > K or x in candidates) for w in candidates}
+        stack = [w for w in candidates if degree[w] <= K]
+        evicted = set(stack)
+        while stack:
+            w = stack.pop()
+            for x in self._adjacency[w]:
+                if x in candidates and x not in evicted:
+                    degree[x] -= 1
+                    if degree[x] <= K:
+                        evicted.add(x)
+                        stack.append(x)
+
+        self._update(u, v, candidates - evicted, K + 1)
+
+    def remove_edge(self, u, v):
+        """Removes the edge ``(u, v)`` and updates the decomposition.
+
+        **Raise**
+
+            ``nx.NetworkXError``
+                Occurs if the edge is not in the graph.
+        """
+        if u not in self._adjacency or v not in self._adjacency[u]:
+            raise nx.NetworkXError("The edge {}-{} is not in the graph.".format(u, v))
+        self._adjacency[u].discard(v)
+        self._adjacency[v].discard(u)
+
+        # The vertices left with less than K neighbors in the K-core drop to the (K-1)-core, and
+        # the drop propagates only to their neighbors of coreness K.
+        K = min(self._core[u], self._core[v])
+        degree = {}
+        dropped = set()
+        stack = []
+        for w in (u, v):
+            if self._core[w] == K and w not in dropped:
+                degree[w] = self._core_degree(w, K)
+                if degree[w] < K:
+                    dropped.add(w)
+                    stack.append(w)
+        # The degree of a vertex ignores the dropped vertices whose neighbors were already updated.
+        propagated = set()
+        while stack:
+            w = stack.pop()
+            propagated.add(w)
+            for x in self._adjacency[w]:
+                if self._core[x] == K and x not in dropped:
+                    if x in degree:
+                        degree[x] -= 1
+                    else:
+                        degree[x] = self._core_degree(x, K, propagated)
+                    if degree[x] < K:
+                        dropped.add(x)
+                        stack.append(x)
+
+        self._update(u, v, dropped, K - 1)
+
+    def add_edges_from(self, edges):
+        for u, v in edges:
+            self.add_edge(u, v)
+
+    def remove_edges_from(self, edges):
+        for u, v in edges:
+            self.remove_edge(u, v)
+
+    def _core_degree(self, w, K, excluded=()):
+        """Number of neighbors of ``w`` in the K-core, ignoring ``excluded``."""
+        return sum(1 for x in self._adjacency[w] if self._core[x] >= K and x not in excluded)
+
+    def _update(self, u, v, changed, k):
+        """Moves the vertices ``changed`` to coreness ``k`` and updates the layers of the touched k-shells."""
+        old_shell = {w: max(1, self._core[w]) for w in changed}
+        old_layer = {w: self._local_layer[w] for w in changed}
+        for w in changed:
+            self._shells[old_shell[w]].discard(w)
+            self._core[w] = k
+            self._shells.setdefault(max(1, k), set()).add(w)
+            if old_shell[w] != max(1, k):
+                self._count_layer(old_shell[w], old_layer[w], -1)
+
+        # Vertices whose membership or neighborhood in the k-cores changed.
+        touched = {u, v} | set(changed)
+        for w in changed:
+            touched.update(self._adjacency[w])
+        shells = {max(1, self._core[w]) for w in touched} | set(old_shell.values())
+        for shell in sorted(shells):
+            self._update_shell(shell, touched, old_shell, old_layer)
+        self._offsets = None
+
+    def _update_shell(self, k, touched, old_shell, old_layer):
+        """Updates the onion layers of the k-shell by propagating the changes layer by layer.
+
+        A vertex keeps its layer as long as none of its neighbors is peeled at another layer below its own.
+        Only the touched vertices and the neighbors of the vertices whose layer changed are peeled again,
+        in the order of the layers, the layer of the others is read as it was before the update.
+        """
+        shell = self._shells.get(k, set())
+        new_layer = {}
+        dirty = set()
+        scheduled = {}
+        heap = []
+
+        def was_in_shell(w):
+            return old_shell.get(w, max(1, self._core[w])) == k
+
+        def previous_layer(w):
+            return old_layer[w] if w in old_layer else self._local_layer[w]
+
+        def next_layer(w, j):
+            # First layer from j at which w can have at most k remaining neighbors. The dirty
+            # neighbors not yet peeled are counted as remaining until they are.
+            lasting = 0
+            layers = []
+            for x in self._adjacency[w]:
+                core = max(1, self._core[x])
+                if core > k or (core == k and x in dirty and x not in new_layer):
+                    lasting += 1
+                elif core == k:
+                    layer = new_layer[x] if x in new_layer else previous_layer(x)
+                    if layer >= j:
+                        layers.append(layer)
+            if lasting + len(layers) <= k:
+                return j
+            if lasting > k:
+                return float("inf")
+            layers.sort(reverse=True)
+            return layers[k - lasting] + 1
+
+        def schedule(w, j, start):
+            # A vertex of the shell is also checked at its previous layer, where it may stop being peeled.
+            if was_in_shell(w) and previous_layer(w) >= start:
+                j = min(j, previous_layer(w))
+            if j < scheduled.get(w, float("inf")):
+                scheduled[w] = j
+                heapq.heappush(heap, (j, next(counter), w))
+
+        def propagate(w, j):
+            # The layer of w differs from the layer j: its neighbors peeled after j may move.
+            for x in self._adjacency[w]:
+                if x in shell and x not in dirty and previous_layer(x) > j:
+                    dirty.add(x)
+                    schedule(x, next_layer(x, j + 1), j + 1)
+
+        counter = itertools.count()
+        dirty.update(w for w in touched if w in shell)
+        for w in dirty:
+            schedule(w, next_layer(w, 1), 1)
+
+        while heap:
+            current, _, w = heapq.heappop(heap)
+            if w in new_layer or scheduled.get(w) != current:
+                continue
+            del scheduled[w]
+            j = next_layer(w, current)
+            if j > current:
+                if was_in_shell(w) and previous_layer(w) == current:
+                    propagate(w, current)
+                schedule(w, j, current + 1)
+                continue
+
+            new_layer[w] = current
+            if not was_in_shell(w) or current < previous_layer(w):
+                propagate(w, current)
+            # The dirty neighbors counted w as remaining.
+            for x in self._adjacency[w]:
+                if x in dirty and x not in new_layer:
+                    schedule(x, current + 1, current + 1)
+
+        for w, layer in new_layer.items():
+            if was_in_shell(w):
+                self._count_layer(k, previous_layer(w), -1)
+            self._local_layer[w] = layer
+            self._count_layer(k, layer, 1)
+        if not shell:
+            self._shells.pop(k, None)
+
+    def _count_layer(self, k, layer, increment):
+        """Updates the number of vertices in a layer of the k-shell."""
+        sizes = self._layer_sizes.setdefault(k, {})
+        sizes[layer] = sizes.get(layer, 0) + increment
+        if sizes[layer] == 0:
+            del sizes[layer]
+            if not sizes:
+                del self._layer_sizes[k]
+
+    def _layer_offsets(self):
+        """Number of layers below each k-shell."""
+        if self._offsets is None:
+            self._offsets = {}
+            total = 0
+            for k in sorted(self._layer_sizes):
+                self._offsets[k] = total
+                total += max(self._layer_sizes[k])
+        return self._offsets
@@ -0,0 +1,44 @@
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+import dynamicalab as dl
+import dynamicalab.algorithms as algo
+
+
+def test_batch_analysis_shared_cache():
+    save_path = tempfile.mkdtemp()
+    rng = np.random.default_rng(0)
+    n = 32
+    try:
+        datasets = []
+        for i in range(n):
+            np.savetxt(os.path.join(save_path, "m{}.txt".format(i)), rng.random((8, 12)) < 0.3, fmt="%d")
+            datasets.append(dl.Dataset("http://127.0.0.1/unused", save_path, "bipartite", "m{}.txt".format(i), None,
+                                       name="m{}".format(i)))
+
+        # Cold cache, every worker updates the same index.
+        rows = algo.batch_analysis(datasets, ["onion_decomposition", "clustering_spectrum"], max_workers=8)
+        assert [(row["dataset"], row["algorithm"]) for row in rows] == \
+            [("m{}".format(i), name) for i in range(n) for name in ("onion_decomposition", "clustering_spectrum")]
+        assert [row["error"] for row in rows] == [None]*(2*n)
+
+        for i, dataset in enumerate(datasets):
+            G = dataset.graph()
+            assert rows[2*i]["result"] == algo.onion_decomposition(G)
+            assert rows[2*i + 1]["result"] == algo.clustering_spectrum(G)
+        cached = [name for name in os.listdir(os.path.join(save_path, ".cache")) if name.endswith(".npz")]
+        assert len(cached) == n
+    finally:
+        shutil.rmtree(save_path)
+
+
+def test_batch_analysis_rejects_unknown_algorithms():
+    for name in ("make_rng", "batch_analysis"):
+        try:
+            algo.batch_analysis([], [name])
+        except ValueError:
+            continue
+        raise AssertionError(name)
@@ -0,0 +1,53 @@
+import networkx as nx
+import numpy as np
+
+import dynamicalab.algorithms as algo
+
+
+def _reference_clustering_spectrum(g):
+    """Average of ``nx.clustering`` in each degree class, as the first implementation of ``clustering_spectrum``."""
+    clustering = nx.clustering(g)
+    spectrum = {}
+    for node, degree in g.degree():
+        if degree > 0:
+            spectrum.setdefault(degree, []).append(clustering[node])
+    return {degree: np.mean(values) for degree, values in spectrum.items()}
+
+
+def _graphs():
+    graphs = [nx.karate_club_graph(), nx.barabasi_albert_graph(500, 4, seed=1), nx.complete_graph(6)]
+    for seed in range(10):
+        G = nx.powerlaw_cluster_graph(200, 3, 0.5, seed=seed)
+        G.add_nodes_from([1000, 1001])
+        graphs.append(G)
+    return graphs
+
+
+def test_clustering_spectrum():
+    for G in _graphs():
+        expected = _reference_clustering_spectrum(G)
+        for g in (G, nx.to_scipy_sparse_array(G, format="csr")):
+            spectrum = algo.clustering_spectrum(g)
+            assert sorted(spectrum) == sorted(expected)
+            assert np.allclose([spectrum[k] for k in expected], list(expected.values()))
+
+
+def test_approximate_clustering_spectrum():
+    epsilon = 0.02
+    for seed in range(3):
+        G = nx.powerlaw_cluster_graph(3000, 4, 0.5, seed=seed)
+        exact = algo.clustering_spectrum(G)
+        spectrum, intervals = algo.clustering_spectrum(G, approximate=True, epsilon=epsilon, seed=seed)
+        assert sorted(spectrum) == sorted(exact) == sorted(intervals)
+        assert max(abs(spectrum[k] - exact[k]) for k in exact) < 3*epsilon
+        # The 95% confidence intervals hold the exact values of most degree classes.
+        assert np.mean([intervals[k][0] <= exact[k] <= intervals[k][1] for k in exact]) > 0.85
+
+    G = nx.karate_club_graph()
+    assert algo.clustering_spectrum(G, approximate=True, n_samples=50, seed=1) == \
+        algo.clustering_spectrum(G, approximate=True, n_samples=50, seed=1)
+    try:
+        algo.clustering_spectrum(G, approximate=True, n_samples=0)
+    except ValueError:
+        return
+    raise AssertionError("n_samples < 1 must raise.")
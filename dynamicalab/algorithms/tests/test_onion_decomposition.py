@@ -0,0 +1,71 @@
+import random
+
+import networkx as nx
+
+import dynamicalab.algorithms as algo
+
+
+def _reference_onion_decomposition(graph):
+    """Peels the layers one at a time, as the first implementation of ``onion_decomposition``."""
+    G = nx.Graph(graph).to_undirected()
+    G.remove_edges_from(list(nx.selfloop_edges(G)))
+    coreness, layers = {}, {}
+    core, layer = 1, 1
+    while G.number_of_nodes() > 0:
+        core = max(core, min(d for _, d in G.degree()))
+        current = [v for v, d in G.degree() if d <= core]
+        for v in current:
+            coreness[v] = core
+            layers[v] = layer
+        G.remove_nodes_from(current)
+        layer += 1
+    return layers, coreness
+
+
+def test_onion_decomposition():
+    graphs = [nx.Graph(), nx.empty_graph(5), nx.karate_club_graph(), nx.barabasi_albert_graph(300, 3, seed=1)]
+    for seed in range(20):
+        G = nx.gnp_random_graph(60, 0.08, seed=seed, directed=seed % 2 == 1)
+        G.add_edges_from([(0, 0), (1, 1)])
+        graphs.append(G)
+    for G in graphs:
+        assert algo.onion_decomposition(G) == _reference_onion_decomposition(G)
+
+
+def test_incremental_onion_decomposition():
+    rng = random.Random(0)
+    for trial in range(100):
+        n = rng.randint(2, 40)
+        G = nx.gnp_random_graph(n, rng.random()*0.3, seed=trial)
+        decomposition = algo.OnionDecomposition(G)
+        assert decomposition.decomposition() == algo.onion_decomposition(G)
+
+        for step in range(50):
+            r = rng.random()
+            if r < 0.5 or G.number_of_edges() == 0:
+                u, v = rng.randrange(n + 3), rng.randrange(n + 3)
+                if u == v:
+                    G.add_node(u)
+                else:
+                    G.add_edge(u, v)
+                decomposition.add_edge(u, v)
+            elif r < 0.95:
+                u, v = rng.choice(list(G.edges()))
+                G.remove_edge(u, v)
+                decomposition.remove_edge(u, v)
+            else:
+                u = rng.choice(list(G.nodes()))
+                G.remove_node(u)
+                decomposition.remove_node(u)
+            # Every update must give the decomposition of the current graph.
+            assert decomposition.decomposition() == algo.onion_decomposition(G), (trial, step)
+            assert len(decomposition) == G.number_of_nodes()
+
+
+def test_incremental_onion_decomposition_errors():
+    decomposition = algo.OnionDecomposition(nx.path_graph(3))
+    try:
+        decomposition.remove_edge(0, 2)
+    except nx.NetworkXError:
+        return
+    raise AssertionError("Removing a missing edge must raise.")
@@ -1,6 +1,8 @@
 import dynamicalab as dlb
 import os
-from ..utils.tqdm_url import TqdmUpTo
+from ._cache import GraphCache
+from .download import download
+from ._weboflife import read_weboflife_json
 
 class Dataset(object):
 	"""
@@ -28,8 +30,11 @@ class Dataset(object):
 	infos : dictionary
 		Information about the dataset. It is accessible through ``print(dataset)``.
 
+	name : String
+		Name of the dataset in the registry, for instance ``food_webs_Angelini_Agostinho_2005``.
+
 	"""
-	def __init__(self, url, save_path, data_type, data_name, compress_type, infos={}):
+	def __init__(self, url, save_path, data_type, data_name, compress_type, infos={}, name=None):
 		"""Initialization of the dataset. Anything is done at this point. To download the dataset, you need to call the method ``dataset.graph()``.
 
 		**Parameters**
@@ -52,6 +57,9 @@ class Dataset(object):
 		infos : dictionary
 			Information about the dataset. It is accessible through ``print(dataset)``.
 
+		name : String : (default=None)
+			Name of the dataset in the registry, for instance ``food_webs_Angelini_Agostinho_2005``.
+
 
 		"""
 		self.url = url
@@ -61,9 +69,10 @@ class Dataset(object):
 		if self.is_valid_compression(compress_type):
 			self.compress_type = compress_type
 		self.infos = infos
+		self.name = name
 		return
 
-	def graph(self, custom_data2graph=None):
+	def graph(self, custom_data2graph=None, use_cache=True, return_type="networkx", node_table=False):
 		"""Construct a networkx Graph of the dataset. 
 
 		1. Check if the file is already downloaded in ``save_path``. If not, download it and copy it.
@@ -73,18 +82,55 @@ class Dataset(object):
 
 		.. note::
 			
-			The constructed graph is not holded in memory.
+			The constructed graph is not holded in memory. It is however cached on disk in ``save_path/.cache``, such that the
+			next calls read a compressed binary copy instead of parsing the raw data again. The cache is keyed by the SHA-256 of the
+			raw file and the ``data_type``, so it is invalidated when the raw file changes. The raw file is hashed again only
+			if its size, modification time, change time or inode changed. If the cache cannot be written, for instance in
+			a read-only ``save_path``, the graph is constructed from the raw data.
 
 		**Parameters**
 
 		custom_data2graph : method
 			If ``None``, this method is called to construct the network. It receives as an argument the path to the data and is expected to return the graph.
 
+		use_cache : bool : (default=True)
+			If False, the graph is always constructed from the raw data. Graphs of ``custom_data2graph`` are never cached.
+
+		return_type : String : (default="networkx")
+			``"networkx"``, or ``"csr"`` for the ``scipy.sparse.csr_matrix`` biadjacency of a ``bipartite`` dataset, whose
+			rows and columns are the two sets of nodes. See ``data2graph``.
+
+		node_table : bool : (default=False)
+			For the web of life datasets, store the node attributes by column in ``G.graph["node_table"]`` instead of
+			a copy of the JSON object of each node. See ``data2graph``.
+
 		"""
 		data_path = self.download_data()
 		if custom_data2graph:
 			return custom_data2graph(data_path)
-		return self.data2graph(data_path)
+		if return_type != "networkx":
+			return self.data2graph(data_path, return_type=return_type)
+		if not use_cache:
+			return self.data2graph(data_path, node_table=node_table)
+
+		cache = GraphCache(self.save_path)
+		cache_type = self.data_type + ("+node_table" if node_table else "")
+		try:
+			G = cache.load(data_path, cache_type)
+		except OSError:
+			# The cache is optional, for instance in a read-only save_path.
+			return self.data2graph(data_path, node_table=node_table)
+		if G is None:
+			G = self.data2graph(data_path, node_table=node_table)
+			try:
+				cache.save(data_path, cache_type, G)
+			except OSError:
+				pass
+		return G
+
+	def clear_cache(self):
+		"""Removes the cached graphs of all the datasets saved in ``save_path``."""
+		GraphCache(self.save_path).clear()
 
 	def is_valid_compression(self, compress_type):
 		if compress_type not in ["ZIP", None]:
@@ -96,18 +142,28 @@ class Dataset(object):
 		fname = os.path.join(self.save_path, self.data_name)
 		return os.path.isfile(fname) 
 
-	def download_data(self):
+	def download_data(self, retries=3, position=None):
+		"""Downloads and uncompresses the data in ``save_path`` if it is not already there, and returns the path to the data.
+
+		The file is written as ``.part`` until it is complete, such that an interrupted download is resumed by the next call.
+
+		**Parameters**
 
-		# Download
-		filename = self.url.rpartition('/')[2]
-		filename_no_extension = filename.rpartition('.')[0]
-		file_path = os.path.join("./", filename)
+		retries : int : (default=3)
+			Number of new attempts after a network error.
 
+		position : int : (default=None)
+			Line of the progress bar, used by ``prefetch``.
+
+		"""
 		if (self.is_downloaded()==False):
-			from six.moves import urllib
-			from tqdm import tqdm
-			with TqdmUpTo(unit='B', unit_scale=True, unit_divisor=1024, desc="Downloading dataset", miniters=1) as t:  # all optional kwargs
-				urllib.request.urlretrieve(self.url, filename=file_path, reporthook=t.update_to)
+			filename = self.url.rpartition('/')[2]
+			filename_no_extension = filename.rpartition('.')[0]
+			if os.path.isdir(self.save_path)==False:
+				os.makedirs(self.save_path, exist_ok=True)
+			file_path = os.path.join(self.save_path, filename)
+
+			download(self.url, file_path, retries=retries, desc=filename, position=position)
 			self.uncompress_data(file_path, filename_no_extension)
 			
 		return self.save_path +"/"+self.data_name
@@ -118,59 +174,66 @@ class Dataset(object):
 			import zipfile
 			with zipfile.ZipFile(file_path, 'r') as myzip:
 				myzip.extractall(self.save_path+"/")
-				os.unlink(file_path)
+			os.unlink(file_path)
 
 		elif self.compress_type == None:
-			if os.path.isdir(self.save_path)==False:
-				os.makedirs(self.save_path)
-			os.rename(file_path, os.path.join(self.save_path,file_path))
+			data_path = os.path.join(self.save_path, self.data_name)
+			if os.path.abspath(file_path) != os.path.abspath(data_path):
+				os.replace(file_path, data_path)
 
 		
-	def data2graph(self, path, create_using=None):
+	def data2graph(self, path, create_using=None, return_type="networkx", node_table=False):
+		"""Constructs the graph from the raw data at ``path`` according to ``data_type``.
+
+		- ``gml``: ``nx.read_gml``.
+		- ``bipartite``: biadjacency matrix, row ``i`` and column ``j`` are the nodes ``i`` and ``n_rows + j``.
+		- ``weboflife_json``, ``weboflife_foodwebs_json``: JSON of the web of life, parsed by chunks. The duplicated nodes of the food webs are merged.
+		- ``edgelist``, ``edgelist_directed``: ``nx.read_edgelist``.
+		- ``adjacency``: adjacency matrix.
+
+		**Parameters**
+
+		path : String
+			Path to the raw data.
+
+		return_type : String : (default="networkx")
+			``"networkx"``, or ``"csr"`` to get the biadjacency of a ``bipartite`` dataset as a ``scipy.sparse.csr_matrix``
+			without building a graph.
+
+		node_table : bool : (default=False)
+			For the web of life datasets, if True, the node attributes are stored by column in ``G.graph["node_table"]``, a dictionary
+			mapping each field to the list of its values in the order of the nodes. Else, each node holds its JSON object in
+			the attribute ``attr_dict``.
+
+		"""
 		import networkx as nx
 		import numpy as np
 
+		if return_type not in ["networkx", "csr"] or (return_type == "csr" and self.data_type != "bipartite"):
+			raise dlb.DynamicaLabNotImplemented
+
 		if self.data_type == "gml":
 			return nx.read_gml(path)
 
 		elif self.data_type == "bipartite":
 
-			A = np.loadtxt(path)
-			G = nx.Graph()
+			A = np.loadtxt(path, ndmin=2)
+			if return_type == "csr":
+				import scipy.sparse
+				return scipy.sparse.csr_matrix(np.where(A>0, A, 0))
 
-			for i in range(A.shape[0]):
-				for j in range(A.shape[1]):
-					if A[i,j]>0:
-						G.add_edge(i,j+A.shape[0], weight=A[i,j])
+			# np.nonzero is row-major, so the nodes and edges are added in the order of the matrix.
+			rows, cols = np.nonzero(A>0)
+			G = nx.Graph()
+			G.add_weighted_edges_from(zip(rows.tolist(), (cols + A.shape[0]).tolist(), A[rows, cols].tolist()))
 
 			return G
 
 		elif self.data_type == "weboflife_json":
-			import json
-			with open(path) as f:
-				json_data = json.load(f)
-				G = nx.Graph()
-				for node in json_data["nodes"]:
-					G.add_node(int(node["nodeid"]), attr_dict=node)
-				for edge in json_data["links"]:
-					source = int(edge["source"])
-					target = int(edge["target"])
-					G.add_edge(source, target)
-
-			return G
+			return read_weboflife_json(path, directed=False, node_table=node_table)
 
 		elif self.data_type == "weboflife_foodwebs_json":
-			import json
-			with open(path) as f:
-				json_data = json.load(f)
-				G = nx.DiGraph()
-				for node in json_data["nodes"]:
-					G.add_node(int(node["nodeid"]), attr_dict=node)
-				for edge in json_data["links"]:
-					source = int(edge["source"])
-					target = int(edge["target"])
-					G.add_edge(source, target)
-
+			G = read_weboflife_json(path, directed=True, node_table=node_table)
 			G = dlb.utils.merge_duplicated_nodes(G)
 			return G
 
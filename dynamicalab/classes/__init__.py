@@ -1,3 +1,5 @@
 
 
-from .Dataset import Dataset
\ No newline at end of file
+from .Dataset import Dataset
+from .download import prefetch
+from ._registry import *
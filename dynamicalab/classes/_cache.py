@@ -0,0 +1,266 @@
+import contextlib
+import hashlib
+import json
+import os
+
+try:
+	import fcntl
+except ImportError:
+	# Without file locks, a concurrent update of the index may be lost, which only costs a new hash of the raw file.
+	fcntl = None
+
+import networkx as nx
+import numpy as np
+
+# Changing the layout of the cached files must change this version to invalidate them.
+CACHE_VERSION = 1
+CACHE_DIR = ".cache"
+INDEX_NAME = "index.json"
+# Key of the JSON objects holding a dictionary with keys other than strings, such as node labels.
+PAIRS_KEY = "__pairs__"
+LOCK_NAME = "index.lock"
+
+_GRAPH_TYPES = {"Graph": nx.Graph, "DiGraph": nx.DiGraph}
+
+
+def file_hash(path, block_size=2**20):
+	"""SHA-256 of the file at ``path``, read by blocks."""
+	sha = hashlib.sha256()
+	with open(path, "rb") as f:
+		for block in iter(lambda: f.read(block_size), b""):
+			sha.update(block)
+	return sha.hexdigest()
+
+
+class GraphCache(object):
+	"""Cache of the parsed graphs of the datasets stored in ``save_path``.
+
+	Each graph is saved in ``save_path/.cache`` as a compressed ``.npz`` holding the
+	edges as integer arrays, the weights as a float array and the node labels and
+	other attributes as JSON. The file is named after the SHA-256 of the raw data
+	and of the ``data_type``, so a modified raw file is never read from a stale cache.
+
+	``index.json`` records the size, modification and change times, inode and hash of each
+	raw file, such that the raw data is hashed again only when one of them changed on disk.
+	An edit that keeps all of them, which requires to reset the change time of the file,
+	is not detected: ``clear`` the cache after such an edit. It is updated
+	under a file lock, so several processes can share the same ``save_path``.
+	"""
+	def __init__(self, save_path):
+		self.path = os.path.join(save_path, CACHE_DIR)
+		self.index_path = os.path.join(self.path, INDEX_NAME)
+		self.lock_path = os.path.join(self.path, LOCK_NAME)
+
+	def load(self, data_path, data_type):
+		"""Returns the cached graph of ``data_path``, or None if it is not cached."""
+		key = self.key(data_path, data_type)
+		cache_file = os.path.join(self.path, key + ".npz")
+		if not os.path.isfile(cache_file):
+			return None
+		try:
+			return load_graph(cache_file)
+		except (OSError, ValueError, KeyError):
+			# Corrupted or incomplete file, it is rewritten by the next save.
+			return None
+
+	def save(self, data_path, data_type, G):
+		"""Stores ``G`` as the graph of ``data_path``. Returns False if ``G`` cannot be cached."""
+		stat = os.stat(data_path)
+		sha256 = self.raw_hash(data_path)
+		key = _cache_key(data_type, sha256)
+		cache_file = os.path.join(self.path, key + ".npz")
+		try:
+			arrays = graph_to_arrays(G)
+		except (TypeError, ValueError):
+			return False
+
+		# Written under a temporary name such that an interrupted save leaves no partial cache,
+		# unique to the process since several workers may load graphs from the same directory.
+		tmp_file = "{}.{}.tmp.npz".format(cache_file, os.getpid())
+		np.savez_compressed(tmp_file, **arrays)
+		os.replace(tmp_file, cache_file)
+
+		with self._locked_index() as index:
+			# The entry written by raw_hash may have been lost if the index could not be locked.
+			entry = index.setdefault(os.path.abspath(data_path), _index_entry(stat, sha256))
+			if entry["sha256"] != sha256:
+				# The raw file was modified meanwhile.
+				self._remove(key)
+				return False
+			previous = entry["caches"].get(data_type)
+			if previous is not None and previous != key:
+				self._remove(previous)
+			entry["caches"][data_type] = key
+		return True
+
+	def key(self, data_path, data_type):
+		"""Cache key of the raw file ``data_path`` read as ``data_type``."""
+		return _cache_key(data_type, self.raw_hash(data_path))
+
+	def raw_hash(self, data_path):
+		"""SHA-256 of the raw file, reused from the index while its size and mtime are unchanged."""
+		stat = os.stat(data_path)
+		index = self._read_index()
+		name = os.path.abspath(data_path)
+		entry = index.get(name)
+		if entry is not None and _same_file(entry, stat):
+			return entry["sha256"]
+
+		sha256 = file_hash(data_path)
+		with self._locked_index() as index:
+			entry = index.get(name)
+			if entry is not None and entry["sha256"] != sha256:
+				for key in entry["caches"].values():
+					self._remove(key)
+				entry = None
+			index[name] = _index_entry(stat, sha256, {} if entry is None else entry["caches"])
+		return sha256
+
+	def clear(self):
+		"""Removes all the cached graphs."""
+		if not os.path.isdir(self.path):
+			return
+		for name in os.listdir(self.path):
+			if name.endswith(".npz") or name == INDEX_NAME:
+				os.unlink(os.path.join(self.path, name))
+
+	def _remove(self, key):
+		cache_file = os.path.join(self.path, key + ".npz")
+		if os.path.isfile(cache_file):
+			os.unlink(cache_file)
+
+	@contextlib.contextmanager
+	def _locked_index(self):
+		"""Reads the index and writes it back once modified, while holding the lock of the cache directory."""
+		os.makedirs(self.path, exist_ok=True)
+		with open(self.lock_path, "a") as lock:
+			if fcntl is not None:
+				fcntl.flock(lock, fcntl.LOCK_EX)
+			try:
+				index = self._read_index()
+				yield index
+				self._write_index(index)
+			finally:
+				if fcntl is not None:
+					fcntl.flock(lock, fcntl.LOCK_UN)
+
+	def _read_index(self):
+		try:
+			with open(self.index_path) as f:
+				return json.load(f)
+		except (OSError, ValueError):
+			return {}
+
+	def _write_index(self, index):
+		os.makedirs(self.path, exist_ok=True)
+		tmp_path = "{}.{}.tmp".format(self.index_path, os.getpid())
+		with open(tmp_path, "w") as f:
+			json.dump(index, f)
+		os.replace(tmp_path, self.index_path)
+
+
+def _cache_key(data_type, sha256):
+	content = "{}:{}:{}".format(CACHE_VERSION, data_type, sha256)
+	return hashlib.sha256(content.encode()).hexdigest()
+
+
+def _index_entry(stat, sha256, caches=None):
+	return {"size": stat.st_size, "mtime": stat.st_mtime, "ctime": stat.st_ctime, "inode": stat.st_ino,
+			"sha256": sha256, "caches": {} if caches is None else caches}
+
+
+def _same_file(entry, stat):
+	"""Whether the raw file is unchanged since its entry of the index was written."""
+	# The change time is also updated by rsync -t or touch, which restore the modification time.
+	return (entry["size"], entry["mtime"], entry.get("ctime"), entry.get("inode")) == \
+		(stat.st_size, stat.st_mtime, stat.st_ctime, stat.st_ino)
+
+
+def _encode_pairs(value):
+	"""Replaces the dictionaries whose keys are not all strings by ``{PAIRS_KEY: [[key, value], ...]}``,
+	since JSON would turn their keys into strings."""
+	if isinstance(value, dict):
+		if all(isinstance(key, str) for key in value) and set(value) != {PAIRS_KEY}:
+			return {key: _encode_pairs(item) for key, item in value.items()}
+		return {PAIRS_KEY: [[_encode_pairs(key), _encode_pairs(item)] for key, item in value.items()]}
+	if isinstance(value, list):
+		return [_encode_pairs(item) for item in value]
+	return value
+
+
+def _decode_pairs(obj):
+	if set(obj) != {PAIRS_KEY}:
+		return obj
+	# Tuple keys, such as edges, were written as lists.
+	return {tuple(key) if isinstance(key, list) else key: item for key, item in obj[PAIRS_KEY]}
+
+
+def _to_json(value):
+	"""Serializes ``value`` as a JSON string array, raises ``ValueError`` if it would not be loaded back identical."""
+	def default(obj):
+		if isinstance(obj, np.generic):
+			return obj.item()
+		raise TypeError("Object of type {} is not JSON serializable".format(type(obj).__name__))
+	text = json.dumps(_encode_pairs(value), default=default)
+	if _from_json(text) != value:
+		raise ValueError("Value changed by the JSON serialization.")
+	return np.array(text)
+
+
+def _from_json(text):
+	return json.loads(str(text), object_hook=_decode_pairs)
+
+
+def graph_to_arrays(G):
+	"""Converts ``G`` into the arrays of a cache file.
+
+	Raises ``TypeError`` or ``ValueError`` if the graph, its labels or its attributes cannot be stored.
+	"""
+	graph_type = type(G).__name__
+	if graph_type not in _GRAPH_TYPES:
+		raise TypeError("Only Graph and DiGraph are cached.")
+
+	nodes = list(G.nodes())
+	labels = [node.item() if isinstance(node, np.generic) else node for node in nodes]
+	if any(type(label) not in (int, float, str) for label in labels):
+		raise TypeError("Node labels must be numbers or strings.")
+
+	index = {node: i for i, node in enumerate(nodes)}
+	edge_data = list(G.edges(data=True))
+	edges = np.array([(index[u], index[v]) for u, v, _ in edge_data], dtype=np.int64).reshape((-1, 2))
+
+	arrays = {
+		"graph_type": np.array(graph_type),
+		"nodes": _to_json(labels),
+		"node_attributes": _to_json([G.nodes[node] for node in nodes]),
+		"graph_attributes": _to_json(G.graph),
+		"edges": edges,
+	}
+
+	# Weighted graphs keep their weights in a float array, any other attribute goes to JSON.
+	if edge_data and all(set(data) == {"weight"} and isinstance(data["weight"], (float, np.floating)) for _, _, data in edge_data):
+		arrays["weights"] = np.array([data["weight"] for _, _, data in edge_data], dtype=np.float64)
+	elif any(data for _, _, data in edge_data):
+		arrays["edge_attributes"] = _to_json([data for _, _, data in edge_data])
+	return arrays
+
+
+def load_graph(path):
+	"""Loads a graph saved by ``GraphCache.save``."""
+	with np.load(path, allow_pickle=False) as data:
+		G = _GRAPH_TYPES[str(data["graph_type"])]()
+		G.graph.update(_from_json(data["graph_attributes"]))
+		nodes = _from_json(data["nodes"])
+		node_attributes = _from_json(data["node_attributes"])
+		G.add_nodes_from(zip(nodes, node_attributes))
+
+		edges = data["edges"]
+		sources = [nodes[i] for i in edges[:, 0].tolist()]
+		targets = [nodes[i] for i in edges[:, 1].tolist()]
+		if "weights" in data:
+			G.add_weighted_edges_from(zip(sources, targets, data["weights"].tolist()))
+		elif "edge_attributes" in data:
+			G.add_edges_from(zip(sources, targets, _from_json(data["edge_attributes"])))
+		else:
+			G.add_edges_from(zip(sources, targets))
+	return G
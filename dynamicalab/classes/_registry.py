@@ -0,0 +1,169 @@
+import bisect
+import json
+import os
+
+from .Dataset import Dataset
+
+__all__ = [
+	'DatasetRegistry',
+	'registry',
+	'iter_datasets',
+]
+
+MANIFEST_PATH = os.path.join(os.path.dirname(__file__), "datasets.json")
+
+
+class DatasetRegistry(object):
+	"""Metadata of the available datasets, read from a JSON manifest.
+
+	The manifest is only read at the first lookup, and indexed by name, collection, ``data_type``
+	and number of nodes, such that listing or filtering the datasets never touches the network
+	nor builds a ``Dataset`` that is not asked for.
+
+	**Parameters**
+
+	path : String : (default=MANIFEST_PATH)
+		Path to the manifest, a JSON file ``{"datasets": [entry, ...]}``. Each entry holds the
+		arguments of ``Dataset`` (``name``, ``url``, ``data_type``, ``data_name``, ``compress_type``,
+		``infos``) and the fields ``collection``, ``nodes``, ``edges``, ``directed``, ``bipartite``
+		and ``components``.
+
+	**Example**
+
+	.. code:: python
+
+		import dynamicalab as dlb
+
+		names = dlb.registry.find(collection="food_webs", max_nodes=50)
+		G = dlb.registry.dataset(names[0], save_path="./data").graph()
+
+	"""
+	def __init__(self, path=MANIFEST_PATH):
+		self.path = path
+		self._entries = None
+
+	def _load(self):
+		if self._entries is not None:
+			return
+		with open(self.path, encoding="utf-8") as f:
+			entries = json.load(f)["datasets"]
+
+		self._by_name = {}
+		self._by_collection = {}
+		self._by_type = {}
+		for entry in entries:
+			self._by_name[entry["name"]] = entry
+			self._by_collection.setdefault(entry["collection"], []).append(entry["name"])
+			self._by_type.setdefault(entry["data_type"], []).append(entry["name"])
+
+		# Sorted node counts for the range queries, datasets of unknown size are left out.
+		sized = sorted((entry["nodes"], i) for i, entry in enumerate(entries) if entry.get("nodes") is not None)
+		self._nodes = [nodes for nodes, _ in sized]
+		self._nodes_order = [entries[i]["name"] for _, i in sized]
+		self._entries = entries
+
+	def __len__(self):
+		self._load()
+		return len(self._entries)
+
+	def __contains__(self, name):
+		self._load()
+		return name in self._by_name
+
+	def __iter__(self):
+		self._load()
+		return iter(entry["name"] for entry in self._entries)
+
+	def collections(self):
+		"""Returns the names of the collections, such as ``plants_pollinators``."""
+		self._load()
+		return list(self._by_collection)
+
+	def get(self, name):
+		"""Returns a copy of the metadata of the dataset ``name``.
+
+		**Raise**
+
+			``KeyError``
+				Occurs if there is no dataset ``name``.
+		"""
+		self._load()
+		entry = dict(self._by_name[name])
+		entry["infos"] = dict(entry["infos"])
+		return entry
+
+	def dataset(self, name, save_path="./data"):
+		"""Returns the ``Dataset`` object of the dataset ``name``, saved in ``save_path``."""
+		entry = self.get(name)
+		return Dataset(entry["url"], save_path, entry["data_type"], entry["data_name"],
+					   entry["compress_type"], entry["infos"], name=name)
+
+	def find(self, collection=None, data_type=None, min_nodes=None, max_nodes=None, name=None):
+		"""Names of the datasets matching all the given filters, in the order of the manifest.
+
+		**Parameters**
+
+		collection : String : (default=None)
+			Collection of the datasets: ``plants_pollinators``, ``food_webs`` or ``connectomes``.
+
+		data_type : String : (default=None)
+			Format of the raw data, see ``Dataset.data2graph``.
+
+		min_nodes, max_nodes : int : (default=None)
+			Bounds, included, on the number of nodes. Datasets of unknown size are excluded when a bound is given.
+
+		name : String : (default=None)
+			Part of the name of the datasets.
+
+		**Returns**
+
+		list of String
+		"""
+		self._load()
+		candidates = None
+		if collection is not None:
+			candidates = set(self._by_collection.get(collection, []))
+		if data_type is not None:
+			candidates = _intersect(candidates, self._by_type.get(data_type, []))
+		if min_nodes is not None or max_nodes is not None:
+			start = 0 if min_nodes is None else bisect.bisect_left(self._nodes, min_nodes)
+			stop = len(self._nodes) if max_nodes is None else bisect.bisect_right(self._nodes, max_nodes)
+			candidates = _intersect(candidates, self._nodes_order[start:stop])
+
+		return [entry["name"] for entry in self._entries
+				if (candidates is None or entry["name"] in candidates)
+				and (name is None or name in entry["name"])]
+
+	def datasets(self, save_path="./data", **filters):
+		"""Generates the ``Dataset`` objects of the datasets selected by ``find(**filters)``, one at a time."""
+		for name in self.find(**filters):
+			yield self.dataset(name, save_path)
+
+
+def _intersect(candidates, names):
+	return set(names) if candidates is None else candidates.intersection(names)
+
+
+registry = DatasetRegistry()
+
+
+def iter_datasets(save_path="./data", **filters):
+	"""Iterator through the registered datasets, optionally filtered.
+
+	**Parameters**
+
+	save_path : String : (default="./data")
+		Directory to which the data will be saved.
+
+	filters :
+		Keyword arguments of ``DatasetRegistry.find``: ``collection``, ``data_type``, ``min_nodes``, ``max_nodes`` and ``name``.
+
+	**Example**
+
+	.. code:: python
+
+		for data in dlb.iter_datasets("./data", collection="food_webs", max_nodes=100):
+			print(data.name, data.graph().number_of_nodes())
+
+	"""
+	return registry.datasets(save_path, **filters)
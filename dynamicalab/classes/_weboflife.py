@@ -0,0 +1,180 @@
+import json
+import re
+from array import array
+
+import networkx as nx
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Characters that can continue a number cut at the end of the buffer, as in "1e" followed by "-07".
+_NUMBER_CHARACTERS = frozenset("0123456789.eE+-")
+# Whitespaces and comma between two items of an array.
+_SEPARATOR = re.compile(r"[ \t\n\r]*,?[ \t\n\r]*")
+
+
+class _Stream(object):
+	"""Text buffer over a file, refilled by chunks as the parser moves forward."""
+	def __init__(self, f, chunk_size):
+		self.f = f
+		self.chunk_size = chunk_size
+		self.buffer = ""
+		self.pos = 0
+		self.eof = False
+
+	def fill(self):
+		"""Reads one more chunk, returns False at the end of the file."""
+		if self.eof:
+			return False
+		chunk = self.f.read(self.chunk_size)
+		self.buffer = self.buffer[self.pos:] + chunk
+		self.pos = 0
+		self.eof = not chunk
+		return bool(chunk)
+
+	def peek(self):
+		"""Next character that is not a whitespace, without consuming it."""
+		while True:
+			self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+			if self.pos < len(self.buffer) or not self.fill():
+				return self.buffer[self.pos:self.pos + 1]
+
+	def expect(self, char):
+		if self.peek() != char:
+			raise ValueError("Expected {!r} at position {} of the JSON buffer.".format(char, self.pos))
+		self.pos += 1
+
+	def decode(self):
+		"""Decodes the next JSON value, reading more chunks until it is complete."""
+		self.peek()
+		while True:
+			try:
+				value, end = _decoder.raw_decode(self.buffer, self.pos)
+				# A number ending with the buffer, or followed by a character that a number can hold,
+				# may continue in the next chunk.
+				if self.eof or (end < len(self.buffer) and self.buffer[end] not in _NUMBER_CHARACTERS):
+					self.pos = end
+					return value
+			except json.JSONDecodeError:
+				if self.eof:
+					raise
+			self.fill()
+
+	def items(self):
+		"""Generates the items of the array whose ``[`` was consumed, and consumes its ``]``.
+
+		The objects that lie entirely in the buffer are decoded at once by ``json.loads``, the items
+		left are decoded one at a time, the slower ``peek`` and ``decode`` only handling the item
+		cut by the end of the buffer.
+		"""
+		while True:
+			buffer = self.buffer
+			pos = _SEPARATOR.match(buffer, self.pos).end()
+			# The buffer up to its last "}" is a list of complete items only if it is valid JSON once
+			# enclosed in brackets, a cut inside a string or a nested object leaves it invalid.
+			last = buffer.rfind("}", pos)
+			if last >= 0 and buffer.startswith("{", pos):
+				try:
+					values = json.loads("[" + buffer[pos:last + 1] + "]")
+				except ValueError:
+					values = None
+				if values is not None:
+					pos = last + 1
+					yield from values
+
+			size = len(buffer)
+			while True:
+				pos = _SEPARATOR.match(buffer, pos).end()
+				if pos >= size or buffer[pos] == "]":
+					break
+				try:
+					value, end = _decoder.raw_decode(buffer, pos)
+				except json.JSONDecodeError:
+					break
+				if end >= size or buffer[end] in _NUMBER_CHARACTERS:
+					break
+				pos = end
+				yield value
+			self.pos = pos
+
+			if self.peek() == "]":
+				self.pos += 1
+				return
+			if self.peek() == ",":
+				self.pos += 1
+			yield self.decode()
+
+
+def iter_json_arrays(f, keys, chunk_size=2**16):
+	"""Generates ``(key, item)`` for the items of the arrays ``keys`` of the top-level JSON object of ``f``.
+
+	Only one item is decoded at a time, the other values of the object are skipped.
+	"""
+	stream = _Stream(f, chunk_size)
+	stream.expect("{")
+	while stream.peek() != "}":
+		if stream.peek() == ",":
+			stream.pos += 1
+		key = stream.decode()
+		stream.expect(":")
+		if key not in keys or stream.peek() != "[":
+			stream.decode()
+			continue
+
+		stream.expect("[")
+		for item in stream.items():
+			yield key, item
+
+
+def read_weboflife_json(path, directed=False, node_table=False, chunk_size=2**16):
+	"""Reads a network of the web of life while parsing the JSON file by chunks.
+
+	The node ids and the links are stored in integer arrays and added to the graph in bulk.
+
+	**Parameters**
+
+	path : String
+		Path to the JSON file.
+
+	directed : bool : (default=False)
+		Construct a ``nx.DiGraph``.
+
+	node_table : bool : (default=False)
+		If False, each node holds its JSON object in the attribute ``attr_dict``. If True, the attributes
+		are stored by column in ``G.graph["node_table"]``, a dictionary mapping each field to the list of
+		its values, with one row per node in the order of the file.
+
+	**Returns**
+
+	nx.Graph or nx.DiGraph
+	"""
+	node_ids = array("q")
+	attributes = []
+	columns = {}
+	sources = array("q")
+	targets = array("q")
+
+	with open(path) as f:
+		for key, item in iter_json_arrays(f, ("nodes", "links"), chunk_size):
+			if key == "nodes":
+				node_ids.append(int(item["nodeid"]))
+				if not node_table:
+					attributes.append(item)
+					continue
+				# Fields missing in some nodes are filled with None, the columns are in the order of appearance.
+				for field in item:
+					if field not in columns:
+						columns[field] = [None]*(len(node_ids) - 1)
+				for field, values in columns.items():
+					values.append(item.get(field))
+			else:
+				sources.append(int(item["source"]))
+				targets.append(int(item["target"]))
+
+	G = nx.DiGraph() if directed else nx.Graph()
+	if node_table:
+		G.add_nodes_from(node_ids.tolist())
+		G.graph["node_table"] = columns
+	else:
+		G.add_nodes_from((node, {"attr_dict": item}) for node, item in zip(node_ids.tolist(), attributes))
+	G.add_edges_from(zip(sources.tolist(), targets.tolist()))
+	return G
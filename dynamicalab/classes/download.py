@@ -0,0 +1,143 @@
+import http.client
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from six.moves import urllib
+
+from ..utils.tqdm_url import TqdmUpTo
+
+__all__ = [
+	'prefetch',
+]
+
+
+def prefetch(datasets, max_workers=4, retries=3):
+	"""Downloads and uncompresses a collection of datasets concurrently.
+
+	The files are fetched by a pool of threads, each with its own progress bar. Interrupted downloads
+	are kept as ``.part`` files and resumed with an HTTP ``Range`` request, by the next retry or by the next call.
+	Datasets already downloaded are skipped.
+
+	**Parameters**
+
+	datasets : iterable of Dataset
+		Datasets to download, for instance ``dlb.food_webs("./data")``.
+
+	max_workers : int : (default=4)
+		Number of simultaneous downloads.
+
+	retries : int : (default=3)
+		Number of new attempts for each file after a network error.
+
+	**Returns**
+
+	list of String
+		Path to the data of each dataset, in the order of ``datasets``.
+
+	**Raise**
+
+		``urllib.error.URLError``, ``OSError``
+			The first error of the datasets that could not be downloaded, once all the other downloads are finished.
+
+	**Example**
+
+	.. code:: python
+
+		import dynamicalab as dlb
+
+		datasets = list(dlb.food_webs("./data"))
+		dlb.prefetch(datasets, max_workers=8)
+		graphs = [data.graph() for data in datasets]
+
+	"""
+	datasets = list(datasets)
+	with ThreadPoolExecutor(max_workers=max_workers) as executor:
+		futures = [executor.submit(dataset.download_data, retries, position)
+				   for position, dataset in enumerate(datasets)]
+
+	errors = [future.exception() for future in futures if future.exception() is not None]
+	if errors:
+		raise errors[0]
+	return [future.result() for future in futures]
+
+
+def download(url, file_path, retries=3, desc=None, position=None, chunk_size=2**16, timeout=60):
+	"""Downloads ``url`` to ``file_path`` through a ``.part`` file, resuming it after errors.
+
+	**Parameters**
+
+	url : String
+		Download url.
+
+	file_path : String
+		Destination of the file. It appears only once the download is complete.
+
+	retries : int : (default=3)
+		Number of new attempts after a network error, with an exponential backoff.
+
+	desc : String : (default=None)
+		Label of the progress bar.
+
+	position : int : (default=None)
+		Line of the progress bar, to display several downloads at once.
+
+	**Returns**
+
+	String
+		``file_path``
+	"""
+	part_path = file_path + ".part"
+	for attempt in range(retries + 1):
+		try:
+			_download_part(url, part_path, desc, position, chunk_size, timeout)
+			os.replace(part_path, file_path)
+			return file_path
+		except (OSError, http.client.HTTPException) as error:
+			if attempt == retries or not _is_retryable(error):
+				raise
+			time.sleep(0.5*2**attempt)
+
+
+def _is_retryable(error):
+	# Client errors such as 404 will not be solved by trying again.
+	if isinstance(error, urllib.error.HTTPError):
+		return error.code >= 500 or error.code == 429
+	return True
+
+
+def _download_part(url, part_path, desc, position, chunk_size, timeout):
+	"""Appends the missing bytes of ``url`` to ``part_path``."""
+	offset = os.path.getsize(part_path) if os.path.isfile(part_path) else 0
+	request = urllib.request.Request(url)
+	if offset > 0:
+		request.add_header("Range", "bytes={}-".format(offset))
+
+	try:
+		response = urllib.request.urlopen(request, timeout=timeout)
+	except urllib.error.HTTPError as error:
+		# The part file already holds the whole file.
+		if error.code == 416 and offset > 0:
+			return
+		raise
+
+	with response:
+		if response.status != 206:
+			# The server ignored the range and sends the whole file.
+			offset = 0
+		length = response.headers.get("Content-Length")
+		total = offset + int(length) if length is not None else None
+
+		with open(part_path, "ab" if offset > 0 else "wb") as f, \
+			 TqdmUpTo(unit='B', unit_scale=True, unit_divisor=1024, desc=desc or "Downloading dataset",
+					  miniters=1, position=position, leave=position is None) as t:
+			size = offset
+			t.update_to(size, 1, total)
+			for chunk in iter(lambda: response.read(chunk_size), b""):
+				f.write(chunk)
+				size += len(chunk)
+				t.update_to(size, 1, total)
+
+	if total is not None and size < total:
+		raise urllib.error.ContentTooShortError(
+			"Retrieval incomplete: got only {} out of {} bytes".format(size, total), None)
@@ -0,0 +1,103 @@
+import json
+import os
+import random
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import dynamicalab as dl
+from dynamicalab.classes._cache import GraphCache
+
+
+def _datasets(save_path, n):
+	return [dl.Dataset("http://127.0.0.1/unused", save_path, "bipartite", "m{}.txt".format(i), None) for i in range(n)]
+
+
+def _load_all(save_path, n, seed):
+	"""Loads every dataset in a random order and returns the ones that could not be cached."""
+	datasets = _datasets(save_path, n)
+	random.Random(seed).shuffle(datasets)
+	failed = []
+	for dataset in datasets:
+		G = dataset.graph()
+		path = os.path.join(save_path, dataset.data_name)
+		if GraphCache(save_path).load(path, "bipartite") is None:
+			failed.append(dataset.data_name)
+		assert G.number_of_edges() == 4
+	return failed
+
+
+def test_cache_shared_by_processes():
+	save_path = tempfile.mkdtemp()
+	n = 48
+	try:
+		for i in range(n):
+			with open(os.path.join(save_path, "m{}.txt".format(i)), "w") as f:
+				f.write("# {}\n1 0 1\n0 1 1\n".format(i))
+		with ProcessPoolExecutor(max_workers=8) as executor:
+			failed = list(executor.map(_load_all, [save_path]*8, [n]*8, range(8)))
+		assert failed == [[]]*8
+
+		# The index holds every raw file, with its cached graph.
+		index = GraphCache(save_path)._read_index()
+		assert len(index) == n
+		assert all(list(entry["caches"]) == ["bipartite"] for entry in index.values())
+		assert not [name for name in os.listdir(os.path.join(save_path, ".cache")) if ".tmp" in name]
+	finally:
+		shutil.rmtree(save_path)
+
+
+def test_merged_food_web_round_trip():
+	save_path = tempfile.mkdtemp()
+	nodes = [{"nodeid": i, "name": name, "group": i % 2} for i, name in enumerate("abcab")]
+	links = [{"source": i, "target": (i + 1) % 5} for i in range(5)]
+	try:
+		with open(os.path.join(save_path, "fw.json"), "w") as f:
+			json.dump({"nodes": nodes, "links": links}, f)
+		dataset = dl.Dataset("http://127.0.0.1/unused", save_path, "weboflife_foodwebs_json", "fw.json", None)
+		for node_table in (False, True):
+			G = dataset.graph(node_table=node_table)
+			assert G.number_of_nodes() == 3
+			# The merged nodes are kept under integer labels in "contraction".
+			assert set(G.nodes[0]["contraction"]) == {3}
+
+			cache_type = "weboflife_foodwebs_json" + ("+node_table" if node_table else "")
+			cached = GraphCache(save_path).load(os.path.join(save_path, "fw.json"), cache_type)
+			assert cached is not None
+			assert list(cached.nodes(data=True)) == list(G.nodes(data=True))
+			assert list(cached.edges()) == list(G.edges())
+			assert cached.graph == G.graph
+	finally:
+		shutil.rmtree(save_path)
+
+
+def test_cache_failures_fall_back_to_raw_data():
+	save_path = tempfile.mkdtemp()
+	try:
+		with open(os.path.join(save_path, "m.txt"), "w") as f:
+			f.write("1 0 1\n0 1 1\n")
+		# The cache directory cannot be created.
+		with open(os.path.join(save_path, ".cache"), "w") as f:
+			f.write("")
+		dataset = dl.Dataset("http://127.0.0.1/unused", save_path, "bipartite", "m.txt", None)
+		assert dataset.graph().number_of_edges() == 4
+	finally:
+		shutil.rmtree(save_path)
+
+
+def test_cache_detects_edits_keeping_size_and_mtime():
+	save_path = tempfile.mkdtemp()
+	path = os.path.join(save_path, "m.txt")
+	try:
+		with open(path, "w") as f:
+			f.write("1 0 1\n0 1 1\n")
+		dataset = dl.Dataset("http://127.0.0.1/unused", save_path, "bipartite", "m.txt", None)
+		assert dataset.graph().number_of_edges() == 4
+
+		stat = os.stat(path)
+		with open(path, "w") as f:
+			f.write("1 0 0\n0 1 1\n")
+		os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+		assert dataset.graph().number_of_edges() == 3
+	finally:
+		shutil.rmtree(save_path)
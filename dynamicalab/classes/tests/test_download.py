@@ -0,0 +1,58 @@
+import os
+import shutil
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import dynamicalab as dl
+
+
+FILES = {"/a.txt": b"1 0 1\n0 1 1\n" * 5000, "/b.txt": b"0 1\n1 1\n" * 5000}
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+	"""Serves ``FILES`` with ``Range`` support, and cuts the first response of each file halfway."""
+	requests = []
+
+	def do_GET(self):
+		data = FILES[self.path]
+		start = 0
+		if "Range" in self.headers:
+			start = int(self.headers["Range"].split("=")[1].rstrip("-"))
+		first = self.path not in [path for path, _ in self.requests]
+		self.requests.append((self.path, start))
+
+		self.send_response(206 if start else 200)
+		self.send_header("Content-Length", str(len(data) - start))
+		self.end_headers()
+		if first:
+			self.wfile.write(data[start:len(data)//2])
+			self.close_connection = True
+			return
+		self.wfile.write(data[start:])
+
+	def log_message(self, *args):
+		return
+
+
+def test_prefetch_resumes_partial_downloads():
+	server = HTTPServer(("127.0.0.1", 0), FlakyHandler)
+	thread = threading.Thread(target=server.serve_forever, daemon=True)
+	thread.start()
+	save_path = tempfile.mkdtemp()
+	try:
+		url = "http://127.0.0.1:{}".format(server.server_port)
+		datasets = [dl.Dataset(url + name, save_path, "bipartite", name[1:], None) for name in FILES]
+		paths = dl.prefetch(datasets, max_workers=2, retries=2)
+
+		for path, name in zip(paths, FILES):
+			with open(path, "rb") as f:
+				assert f.read() == FILES[name]
+			# The second request only asks for the missing half.
+			assert (name, len(FILES[name])//2) in FlakyHandler.requests
+		assert not [name for name in os.listdir(save_path) if name.endswith(".part")]
+		assert datasets[0].graph().number_of_edges() == 20000
+	finally:
+		server.shutdown()
+		server.server_close()
+		shutil.rmtree(save_path)
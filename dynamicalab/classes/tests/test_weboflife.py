@@ -0,0 +1,33 @@
+import io
+import json
+import random
+
+from dynamicalab.classes._weboflife import iter_json_arrays
+
+
+def _random_value(rng, depth=0):
+	kind = rng.randrange(8 if depth < 3 else 5)
+	if kind == 0:
+		return rng.randint(-10**6, 10**6)
+	if kind == 1:
+		return rng.choice([1e-07, -2.5e+30, 0.5, 1.0, -0.0, rng.uniform(-1e3, 1e3)])
+	if kind == 2:
+		return rng.choice(["", "a b", "é\"\\", "1e-07", "[{,}]"])
+	if kind == 3:
+		return rng.choice([True, False, None])
+	if kind == 4:
+		return rng.random()*10**rng.randint(-12, 12)
+	if kind == 5:
+		return [_random_value(rng, depth + 1) for _ in range(rng.randrange(4))]
+	return {str(rng.randrange(100)): _random_value(rng, depth + 1) for _ in range(rng.randrange(4))}
+
+
+def test_iter_json_arrays_matches_json_load():
+	rng = random.Random(0)
+	for trial in range(300):
+		document = {key: [_random_value(rng) for _ in range(rng.randrange(6))] if key in ("nodes", "links") else _random_value(rng)
+					for key in rng.sample(["nodes", "links", "a", "b", "c"], rng.randint(1, 5))}
+		text = json.dumps(document, indent=rng.choice([None, 1, "\t"]), separators=rng.choice([None, (",", ":")]))
+		expected = [(key, item) for key, value in json.loads(text).items() if key in ("nodes", "links") for item in value]
+		for chunk_size in (1, 2, 3, 7, 64):
+			assert list(iter_json_arrays(io.StringIO(text), ("nodes", "links"), chunk_size)) == expected, (trial, chunk_size)
@@ -1,3 +1,7 @@
+from .reducers import *
+from .packed import *
 from .sis import *
+from .continuous_sis import *
 from .thetamodel import *
-from .bernoulli import *
\ No newline at end of file
+from .bernoulli import *
+from .sweep import *
\ No newline at end of file
@@ -1,7 +1,49 @@
 import os
 import numpy as np
+import networkx as nx
+import scipy.sparse
 import abc
 
+from .reducers import Reducer, StepFunction
+from .packed import PackedStates
+from ..utils.rng import make_rng
+
+
+def _csr_adjacency(G, weight=None):
+    """Adjacency matrix of ``G`` in CSR format.
+
+    Rows and columns follow the order of ``G.nodes()``. ``G`` can also be a
+    ``scipy.sparse`` adjacency matrix. If ``weight`` is None, edge weights and
+    multi-edges are ignored and only the presence of an edge is kept.
+    """
+    if scipy.sparse.issparse(G):
+        A = scipy.sparse.csr_matrix(G, copy=True)
+    elif hasattr(nx, "to_scipy_sparse_array"):
+        A = nx.to_scipy_sparse_array(G, weight=weight, format="csr")
+    else:
+        A = nx.to_scipy_sparse_matrix(G, weight=weight, format="csr")
+    if weight is None:
+        A.data[:] = 1
+    return A
+
+
+def _number_of_nodes(G):
+    """Number of nodes of a graph or of a sparse adjacency matrix."""
+    if scipy.sparse.issparse(G):
+        return G.shape[0]
+    return G.number_of_nodes()
+
+
+def _chunks(states, n_steps, chunk_size, dtype=np.float64):
+    """Groups an iterator of states into arrays of at most ``chunk_size`` states."""
+    for start in range(0, n_steps, chunk_size):
+        chunk = None
+        for t, x in zip(range(min(chunk_size, n_steps - start)), states):
+            if chunk is None:
+                chunk = np.empty((min(chunk_size, n_steps - start),) + x.shape, dtype=dtype)
+            chunk[t] = x
+        yield chunk
+
 class BaseDynamics(metaclass=abc.ABCMeta):
     """
     Base class for all dynamics processes. All dynamics have
@@ -21,18 +63,22 @@ class BaseDynamics(metaclass=abc.ABCMeta):
             X = dynamics(G, T)
     
     ``X`` is a numpy array of shape ``(len(T), N)``.
+
+    All dynamics accept a ``seed`` (an integer, a ``np.random.SeedSequence`` or a
+    ``np.random.Generator``) and draw their random numbers from ``self.rng``.
     """
-    def __init__(self):
+    def __init__(self, seed=None):
+        self.rng = make_rng(seed)
         return
 
     @abc.abstractmethod
-    def __call__(self, G, T, x0=None):
+    def __call__(self, G, T, x0=None, reducers=None):
         """Generates a sequence of states for each time
     
         **Params**
 
-        G : nx.Graph
-            Graph structure 
+        G : nx.Graph or scipy.sparse matrix
+            Graph structure or its (weighted) adjacency matrix.
 
         T : list
             List of times. 
@@ -41,14 +87,177 @@ class BaseDynamics(metaclass=abc.ABCMeta):
             Initial state of each node. The node index should match the 
             node index in `x0`. If `x0==None`, the initial state is build
             using `self.best_x0` method.
+
+        reducers : list or dict of Reducer : (default=None)
+            Observables accumulated during the run (see ``dynamicalab.dynamics.reducers``).
+            Plain functions are wrapped in ``StepFunction``. If not None, the trajectory is
+            never stored and only the observables are returned.
  
         **Returns**
 
         ``np.array(len(T), N)`` : Numpy array of activities
 
+        or a dictionary mapping the name of each reducer to its result if ``reducers`` is given.
+
         """
         return
 
+    def simulate_ensemble(self, G, T, n_runs, x0=None):
+        """Generates ``n_runs`` independent realizations of the dynamics on the same graph.
+
+        Subclasses override this method to advance all the realizations together
+        as one batched state of shape ``(n_runs, N)``. The default implementation
+        calls ``__call__`` once per realization.
+
+        **Params**
+
+        G : nx.Graph
+            Graph structure
+
+        T : list
+            List of times.
+
+        n_runs : int
+            Number of realizations.
+
+        x0 : np.array(N) or np.array(n_runs, N) : (default=None)
+            Initial state of the realizations. A single state is shared by all the
+            realizations. If `x0==None`, each realization gets its own initial state
+            from `self.best_x0`.
+
+        **Returns**
+
+        ``np.array(n_runs, len(T), N)`` : Numpy array of activities
+
+        """
+        X0 = self._ensemble_x0(G, n_runs, x0)
+        if n_runs == 0:
+            return np.zeros((0, len(T), _number_of_nodes(G)))
+        # The output is allocated after the first run, with its dtype and shape.
+        for run in range(n_runs):
+            X_run = self(G, T, X0[run])
+            if isinstance(X_run, PackedStates):
+                if run == 0:
+                    X = np.zeros((n_runs,) + X_run.packed.shape, dtype=np.uint8)
+                X[run] = X_run.packed
+            else:
+                if run == 0:
+                    X = np.zeros((n_runs,) + X_run.shape, dtype=X_run.dtype)
+                X[run] = X_run
+
+        if isinstance(X_run, PackedStates):
+            return PackedStates(X, X_run.N)
+        return X
+
+    def iter_states(self, G, T, x0=None, chunk_size=1000):
+        """Generates the sequence of states by chunks of consecutive times.
+
+        Only one chunk is held in memory at once, which allows long trajectories on
+        large graphs. The default implementation slices the output of ``__call__``;
+        subclasses override it to generate the chunks one after the other.
+
+        **Params**
+
+        G : nx.Graph or scipy.sparse matrix
+            Graph structure or its (weighted) adjacency matrix.
+
+        T : list
+            List of times.
+
+        x0 : np.array(N) : (default=None)
+            Initial state of each node.
+
+        chunk_size : int : (default=1000)
+            Maximal number of times in each chunk.
+
+        **Returns**
+
+        generator
+            Yields ``np.array(n, N)`` arrays, with ``n <= chunk_size``, whose
+            concatenation is the output of ``__call__``.
+
+        """
+        X = self(G, T, x0)
+        for start in range(0, len(T), chunk_size):
+            yield X[start:start + chunk_size]
+
+    def write_states(self, G, T, out, x0=None, chunk_size=1000):
+        """Writes the sequence of states directly into ``out``, chunk by chunk.
+
+        **Params**
+
+        G : nx.Graph or scipy.sparse matrix
+            Graph structure or its (weighted) adjacency matrix.
+
+        T : list
+            List of times.
+
+        out : String or np.array(len(T), N)
+            Either the path of a ``.npy`` file, created as a memory map of shape
+            ``(len(T), N)``, or a preallocated array. Packed binary states are
+            written as their ``uint8`` array of shape ``(len(T), ceil(N/8))``.
+
+        x0 : np.array(N) : (default=None)
+            Initial state of each node.
+
+        chunk_size : int : (default=1000)
+            Maximal number of times generated at once.
+
+        **Returns**
+
+        ``out`` or the ``np.memmap`` of the file.
+
+        **Example**
+
+        .. code:: python
+
+            X = dynamics.write_states(G, np.arange(10**5), "trajectory.npy")
+            X = np.load("trajectory.npy", mmap_mode="r")
+
+        """
+        start = 0
+        for chunk in self.iter_states(G, T, x0, chunk_size):
+            if isinstance(chunk, PackedStates):
+                chunk = chunk.packed
+            if isinstance(out, str):
+                out = np.lib.format.open_memmap(out, mode="w+", dtype=chunk.dtype,
+                                                shape=(len(T),) + chunk.shape[1:])
+            out[start:start + len(chunk)] = chunk
+            start += len(chunk)
+
+        if isinstance(out, np.memmap):
+            out.flush()
+        return out
+
+    def _reduce(self, G, T, x0, reducers, chunk_size=100):
+        """Runs the dynamics chunk by chunk and returns the results of ``reducers``."""
+        if not isinstance(reducers, dict):
+            reducers = {getattr(reducer, "name", getattr(reducer, "__name__", None)): reducer
+                        for reducer in reducers}
+        reducers = {name: reducer if isinstance(reducer, Reducer) else StepFunction(reducer, name)
+                    for name, reducer in reducers.items()}
+
+        for reducer in reducers.values():
+            reducer.reset(len(T), _number_of_nodes(G))
+        for chunk in self.iter_states(G, T, x0, chunk_size):
+            if isinstance(chunk, PackedStates):
+                chunk = chunk.unpack()
+            for reducer in reducers.values():
+                reducer.update(chunk)
+        return {name: reducer.result() for name, reducer in reducers.items()}
+
     def best_x0(self, G):
-        N = G.number_of_nodes()
-        return np.random.random(N)
+        N = _number_of_nodes(G)
+        return self.rng.random(N)
+
+    def _ensemble_x0(self, G, n_runs, x0=None):
+        """Initial states of an ensemble as an array of shape ``(n_runs, N)``."""
+        if x0 is None:
+            return np.array([self.best_x0(G) for run in range(n_runs)])
+
+        x0 = np.asarray(x0)
+        if x0.ndim == 1:
+            return np.tile(x0, (n_runs, 1))
+        if x0.shape[0] != n_runs:
+            raise ValueError("x0 must have shape (N,) or (n_runs, N).")
+        return x0
@@ -1,10 +1,10 @@
-from .base import BaseDynamics
-import numpy as np
+from .base import BaseDynamics, _number_of_nodes
+from .packed import _format_states, _collect_states, _check_state_format
 
 class BernoulliDynamics(BaseDynamics):
     """Random binary dynamics with probability ``p`` of being active."""
 
-    def __init__(self, p=None):
+    def __init__(self, p=None, state_format="float", seed=None):
         """
         **Params**
 
@@ -12,21 +12,53 @@ class BernoulliDynamics(BaseDynamics):
             Probability of being active (x=1). If None, then ``p``
             is choosen randomly between 0 and 1.
 
+        state_format : String : (default="float")
+            Type of the returned states: ``"float"`` (0. or 1.), ``"bool"`` or ``"packed"``
+            (``PackedStates``, 8 nodes per byte).
+
+        seed : int, np.random.SeedSequence or np.random.Generator : (default=None)
+            Seed of the random number generator.
+
         """
-        super(BernoulliDynamics, self).__init__()
+        super(BernoulliDynamics, self).__init__(seed)
 
         if p is None:
-            self.p = np.random.rand()
+            self.p = self.rng.random()
         else:
             self.p = p
+        self.state_format = _check_state_format(state_format)
             
-    def __call__(self, G, T, x0=None):
+    def __call__(self, G, T, x0=None, reducers=None):
+
+        if reducers is not None:
+            return self._reduce(G, T, x0, reducers)
+
+        shape = (len(T), _number_of_nodes(G))
+        return _collect_states(self.__states(shape), shape, self.state_format)
 
-        num_time_steps = len(T)
-        _x = np.random.rand(num_time_steps, len(G))
+    def iter_states(self, G, T, x0=None, chunk_size=1000):
+        """Generates the states by chunks, see ``BaseDynamics.iter_states``."""
+        N = _number_of_nodes(G)
+        for start in range(0, len(T), chunk_size):
+            _x = self.rng.random((min(chunk_size, len(T) - start), N))
 
-        X = np.zeros([num_time_steps, len(G)])
-        X[_x < self.p] = 1
+            yield _format_states(_x < self.p, self.state_format)
 
-        return  X
+    def simulate_ensemble(self, G, T, n_runs, x0=None):
+        """The realizations are drawn one after the other, by chunks of times, such that
+        only one chunk of random numbers is held in memory next to the output."""
+        shape = (len(T), _number_of_nodes(G))
+        X = _collect_states((), (n_runs,) + shape, self.state_format)
+        for run in range(n_runs):
+            X_run = _collect_states(self.__states(shape), shape, self.state_format)
+            if self.state_format == "packed":
+                X.packed[run] = X_run.packed
+            else:
+                X[run] = X_run
+        return X
 
+    def __states(self, shape, chunk_size=1000):
+        """Generates the states one by one, drawing them by chunks."""
+        num_time_steps, N = shape
+        for start in range(0, num_time_steps, chunk_size):
+            yield from self.rng.random((min(chunk_size, num_time_steps - start), N)) < self.p
@@ -0,0 +1,140 @@
+import numpy as np
+from .base import BaseDynamics, _csr_adjacency, _number_of_nodes, _chunks
+from .packed import _format_states, _collect_states, _check_state_format
+
+class ContinuousSISDynamics(BaseDynamics):
+    """Markovian continuous time Suceptible-infected-suceptible process on networks.
+
+    The process is simulated event by event with the optimized Gillespie
+    algorithm of `Cota and Ferreira, 2017 <https://doi.org/10.1016/j.cpc.2017.06.007>`_.
+    Infected nodes are kept in an indexed list, and the node transmitting an
+    infection is chosen by rejection sampling proportionally to its degree, so
+    each event costs O(1) on average instead of a scan of the whole network.
+    """
+    def __init__(self, infection_rate, recovery_rate, block_size=4096, state_format="float", seed=None):
+        """
+        **Parameters**
+
+        infection_rate : Float
+            Rate of infection along each edge from an infected node.
+
+        recovery_rate : Float
+            Rate of recovery of each infected node.
+
+        block_size : int : (default=4096)
+            Number of random numbers drawn at once.
+
+        state_format : String : (default="float")
+            Type of the returned states: ``"float"`` (0. or 1.), ``"bool"`` or ``"packed"``
+            (``PackedStates``, 8 nodes per byte).
+
+        seed : int, np.random.SeedSequence or np.random.Generator : (default=None)
+            Seed of the random number generator.
+
+
+        Contrary to ``SISDynamics``, the `__call__(G, T)` method uses the values of ``T``: the
+        process starts at ``T[0]`` from ``x0`` and ``X[t]`` is the state at time ``T[t]``.
+        """
+        super(ContinuousSISDynamics, self).__init__(seed)
+        self.infection_rate = infection_rate
+        self.recovery_rate = recovery_rate
+        self.block_size = block_size
+        self.state_format = _check_state_format(state_format)
+
+    def __call__(self, G, T, x0=None, reducers=None):
+
+        if reducers is not None:
+            return self._reduce(G, T, x0, reducers)
+
+        if x0 is None:
+            x0 = self.best_x0(G)
+
+        shape = (len(T), _number_of_nodes(G))
+        return _collect_states(self.__states(G, T, x0), shape, self.state_format)
+
+    def iter_states(self, G, T, x0=None, chunk_size=1000):
+        """Generates the states by chunks, see ``BaseDynamics.iter_states``."""
+        if x0 is None:
+            x0 = self.best_x0(G)
+
+        for chunk in _chunks(self.__states(G, T, x0), len(T), chunk_size, dtype=bool):
+            yield _format_states(chunk, self.state_format)
+
+    def __states(self, G, T, x0):
+        """Simulates the events and generates the state at each time of ``T``."""
+        A = _csr_adjacency(G)
+        indptr = A.indptr.tolist()
+        indices = A.indices.tolist()
+        degrees = np.diff(A.indptr).tolist()
+        k_max = max(max(degrees, default=0), 1)
+        N = len(degrees)
+
+        #indexed list of infected nodes
+        state = [bool(x == 1) for x in np.asarray(x0)]
+        infected = [node for node in range(N) if state[node]]
+        position = [-1]*N
+        for i, node in enumerate(infected):
+            position[node] = i
+        n_edges = sum(degrees[node] for node in infected)
+
+        x = np.asarray(state)
+        random = self.__random_numbers()
+
+        t = T[0] if len(T) > 0 else 0
+        index = 0
+        while index < len(T):
+            rate = self.recovery_rate*len(infected) + self.infection_rate*n_edges
+            if rate == 0:
+                #absorbing state
+                for index in range(index, len(T)):
+                    yield x
+                break
+
+            t += -np.log(1.0 - next(random))/rate
+            while index < len(T) and T[index] < t:
+                yield x.copy()
+                index += 1
+
+            if next(random)*rate < self.recovery_rate*len(infected):
+                #recovery of a random infected node
+                node = infected[int(next(random)*len(infected))]
+                last = infected.pop()
+                if last != node:
+                    infected[position[node]] = last
+                    position[last] = position[node]
+                position[node] = -1
+                state[node] = False
+                x[node] = False
+                n_edges -= degrees[node]
+            else:
+                #infected node chosen proportionally to its degree
+                node = infected[int(next(random)*len(infected))]
+                while next(random)*k_max >= degrees[node]:
+                    node = infected[int(next(random)*len(infected))]
+                neighbor = indices[indptr[node] + int(next(random)*degrees[node])]
+                if not state[neighbor]:
+                    position[neighbor] = len(infected)
+                    infected.append(neighbor)
+                    state[neighbor] = True
+                    x[neighbor] = True
+                    n_edges += degrees[neighbor]
+
+    def best_x0(self, G):
+        """Convenient method to get a good initial state given as a random infection.
+
+        **Params**
+
+        G : nx.Graph
+            Network structure
+
+        **Returns**
+
+        np.array(N): Binary state of each node.
+        """
+        N = _number_of_nodes(G)
+        return self.rng.integers(0,2, size=(N,))
+
+    def __random_numbers(self):
+        """Uniform random numbers drawn by blocks."""
+        while True:
+            yield from self.rng.random(self.block_size).tolist()
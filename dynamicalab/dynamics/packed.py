@@ -0,0 +1,101 @@
+import numpy as np
+
+__all__ = [
+    'PackedStates',
+]
+
+
+class PackedStates(object):
+    """Binary states packed 8 nodes per byte with ``np.packbits``.
+
+    Behaves as a read-only array of shape ``(..., len(T), N)`` whose rows are
+    unpacked only when they are accessed, so a trajectory takes 1/64 of the memory
+    of the equivalent ``float64`` array.
+
+    **Parameters**
+
+    packed : np.array(..., len(T), ceil(N/8)) of uint8
+        Packed states, as returned by ``np.packbits(X, axis=-1)``.
+
+    N : int
+        Number of nodes.
+
+    **Example**
+
+    .. code:: python
+
+        dynamics = dyn.SISDynamics(0.1, 0.2, state_format="packed")
+        X = dynamics(G, T)
+        X[10]           # state at T[10] as a boolean array
+        X.unpack()      # whole trajectory as a boolean array
+        X.save("trajectory.npz")
+
+    """
+    def __init__(self, packed, N):
+        self.packed = packed
+        self.N = N
+
+    @property
+    def shape(self):
+        return self.packed.shape[:-1] + (self.N,)
+
+    @property
+    def nbytes(self):
+        return self.packed.nbytes
+
+    def __len__(self):
+        return len(self.packed)
+
+    def __getitem__(self, index):
+        """Unpacks the states selected by ``index``, which indexes every axis but the nodes."""
+        return np.unpackbits(self.packed[index], axis=-1, count=self.N).astype(bool)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def unpack(self, dtype=bool):
+        """Returns all the states as an array of type ``dtype``."""
+        return np.unpackbits(self.packed, axis=-1, count=self.N).astype(dtype)
+
+    def save(self, path):
+        """Saves the packed states in an uncompressed ``.npz`` file."""
+        np.savez(path, packed=self.packed, N=self.N)
+
+    @classmethod
+    def load(cls, path):
+        """Loads states saved with ``save``."""
+        with np.load(path) as data:
+            return cls(data["packed"], int(data["N"]))
+
+
+def _format_states(X, state_format):
+    """Converts boolean states ``X`` of shape ``(..., N)`` to ``state_format``."""
+    if state_format == "packed":
+        return PackedStates(np.packbits(X, axis=-1), X.shape[-1])
+    if state_format == "bool":
+        return X.astype(bool, copy=False)
+    return X.astype(np.float64)
+
+
+def _collect_states(states, shape, state_format):
+    """Stores the boolean states generated by ``states`` in an array of shape
+    ``(..., len(T), N)`` of the requested format, packing each state on the fly.
+    """
+    if state_format == "packed":
+        X = np.zeros(shape[:-1] + ((shape[-1] + 7) // 8,), dtype=np.uint8)
+    else:
+        X = np.zeros(shape, dtype=bool if state_format == "bool" else np.float64)
+
+    for t, state in enumerate(states):
+        X[..., t, :] = np.packbits(state, axis=-1) if state_format == "packed" else state
+
+    if state_format == "packed":
+        return PackedStates(X, shape[-1])
+    return X
+
+
+def _check_state_format(state_format):
+    if state_format not in ["float", "bool", "packed"]:
+        raise ValueError("state_format must be 'float', 'bool' or 'packed'.")
+    return state_format
@@ -0,0 +1,127 @@
+import numpy as np
+
+__all__ = [
+    'Reducer',
+    'Prevalence',
+    'TimeAverage',
+    'ActivityFrequency',
+    'StepFunction',
+]
+
+
+class Reducer(object):
+    """Base class for observables accumulated during a run of a dynamics.
+
+    A reducer receives the states chunk by chunk and keeps only what it needs,
+    so a run with reducers never holds the whole ``(len(T), N)`` trajectory.
+    Custom reducers implement ``reset``, ``update`` and ``result``.
+
+    **Example**
+
+    .. code:: python
+
+        import networkx as nx
+        import numpy as np
+        import dynamicalab.dynamics as dyn
+
+        G = nx.erdos_renyi_graph(1000, 0.01)
+        dynamics = dyn.SISDynamics(0.1, 0.2)
+        out = dynamics(G, np.arange(1000), reducers=[dyn.Prevalence(), dyn.ActivityFrequency()])
+        out["prevalence"], out["activity_frequency"]
+
+    """
+    name = "reducer"
+
+    def reset(self, n_steps, N):
+        """Called once before the run with the number of times and of nodes."""
+        return
+
+    def update(self, X):
+        """Called with each chunk ``np.array(n, N)`` of consecutive states."""
+        raise NotImplementedError
+
+    def result(self):
+        """Returns the observable at the end of the run."""
+        raise NotImplementedError
+
+
+class StepFunction(Reducer):
+    """Applies ``function`` to each state and stacks the values, one per time.
+
+    **Parameters**
+
+    function : method
+        Called as ``function(X)`` on a chunk ``np.array(n, N)`` and returning
+        ``n`` values.
+
+    name : String : (default="step_function")
+        Key of the result.
+    """
+    def __init__(self, function, name="step_function"):
+        self.function = function
+        self.name = name
+
+    def reset(self, n_steps, N):
+        self._n_steps = n_steps
+        self._values = None
+        self._t = 0
+
+    def update(self, X):
+        values = np.asarray(self.function(X))
+        if self._values is None:
+            self._values = np.empty((self._n_steps,) + values.shape[1:], dtype=values.dtype)
+        self._values[self._t:self._t + len(values)] = values
+        self._t += len(values)
+
+    def result(self):
+        return self._values
+
+
+class Prevalence(StepFunction):
+    """Fraction of active nodes at each time, ``np.array(len(T))``."""
+    def __init__(self, name="prevalence"):
+        self.name = name
+
+    @staticmethod
+    def function(X):
+        return X.mean(axis=1)
+
+
+class TimeAverage(Reducer):
+    """Time average of the state of each node, ``np.array(N)``.
+
+    **Parameters**
+
+    function : method : (default=None)
+        If not None, the average of ``function(X)`` is computed instead, for
+        instance ``np.cos`` for the theta model without ``cos_transform``.
+
+    name : String : (default="time_average")
+        Key of the result.
+    """
+    def __init__(self, function=None, name="time_average"):
+        self.function = function
+        self.name = name
+
+    def reset(self, n_steps, N):
+        self._sum = np.zeros(N)
+        self._n = 0
+
+    def update(self, X):
+        if self.function is not None:
+            X = self.function(X)
+        self._sum += X.sum(axis=0)
+        self._n += len(X)
+
+    def result(self):
+        return self._sum / max(self._n, 1)
+
+
+class ActivityFrequency(TimeAverage):
+    """Fraction of the times each node is active (state > 0), ``np.array(N)``."""
+    def __init__(self, name="activity_frequency"):
+        self.name = name
+
+    @staticmethod
+    def function(X):
+        return X > 0
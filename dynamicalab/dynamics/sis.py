@@ -1,11 +1,11 @@
 import numpy as np
-from numpy.random import random
-from .base import BaseDynamics
+from .base import BaseDynamics, _csr_adjacency, _number_of_nodes, _chunks
+from .packed import _format_states, _collect_states, _check_state_format
 
 class SISDynamics(BaseDynamics):
     """Markovian discrete time Suceptible-infected-suceptible process on networks. 
     """
-    def __init__(self, p, q, self_activation=0):
+    def __init__(self, p, q, self_activation=0, state_format="float", seed=None):
         """
         **Parameters**
 
@@ -17,34 +17,54 @@ class SISDynamics(BaseDynamics):
 
         self_activation : Float : (default=0)
             Probability of spontaneous activation
+
+        state_format : String : (default="float")
+            Type of the returned states: ``"float"`` (0. or 1.), ``"bool"`` or ``"packed"``
+            (``PackedStates``, 8 nodes per byte).
+
+        seed : int, np.random.SeedSequence or np.random.Generator : (default=None)
+            Seed of the random number generator.
         
 
         Note that the `__call__(G, T)` method is independent of ``T[i]-T[i+1]``. Only ``len(T)`` is 
         taken into account for the number of steps.
+
+        The whole state vector is advanced at once: a susceptible node with ``k`` infected
+        neighbors becomes infected with probability ``1-(1-p)^k`` and an infected node
+        recovers with probability ``q``.
         """
-        super(SISDynamics, self).__init__()
+        super(SISDynamics, self).__init__(seed)
         self.p = p
         self.q = q
         self.self_activation = self_activation
-        self.infected_node_set = set()
+        self.state_format = _check_state_format(state_format)
 
-    def __call__(self, G, T, x0=None):
+    def __call__(self, G, T, x0=None, reducers=None):
+
+        if reducers is not None:
+            return self._reduce(G, T, x0, reducers)
         
         if x0 is None:
             x0 = self.best_x0(G)
 
-        #initialize
-        for node in range(len(x0)):
-            if x0[node] == 1:
-                self.infected_node_set.add(node)
-        X = []
+        return self.__run(G, T, np.asarray(x0) == 1)
+
+    def simulate_ensemble(self, G, T, n_runs, x0=None):
+        """All the realizations are advanced together as a ``(n_runs, N)`` state."""
+        if n_runs == 0:
+            return _collect_states((), (0, len(T), _number_of_nodes(G)), self.state_format)
+        X0 = self._ensemble_x0(G, n_runs, x0)
 
-        for t in T:
-            self.__step(G)
-            X.append(self.__get_state(G))
-            
-        self.infected_node_set = set()
-        return np.array(X)
+        return self.__run(G, T, X0 == 1)
+
+    def iter_states(self, G, T, x0=None, chunk_size=1000):
+        """Generates the states by chunks, see ``BaseDynamics.iter_states``."""
+        if x0 is None:
+            x0 = self.best_x0(G)
+
+        states = self.__states(G, T, np.asarray(x0) == 1)
+        for chunk in _chunks(states, len(T), chunk_size, dtype=bool):
+            yield _format_states(chunk, self.state_format)
 
     def best_x0(self, G):
         """Convenient method to get a good initial state given as a random infection.
@@ -58,40 +78,38 @@ class SISDynamics(BaseDynamics):
 
         np.array(N): Binary state of each node.
         """
-        N = G.number_of_nodes()
-        return np.random.randint(0,2, size=(N,))
+        N = _number_of_nodes(G)
+        return self.rng.integers(0,2, size=(N,))
+
+    def __run(self, G, T, x):
+        """Iterates the process from the binary state ``x`` of shape ``(..., N)``."""
+        shape = x.shape[:-1] + (len(T), x.shape[-1])
+        return _collect_states(self.__states(G, T, x), shape, self.state_format)
 
-    def __step(self, G):
+    def __states(self, G, T, x):
+        """Generates the state after each time step."""
+        # Infections travel along the out-edges of infected nodes.
+        A_in = _csr_adjacency(G).T.tocsr()
+
+        for t in range(len(T)):
+            x = self.__step(A_in, x)
+            yield self.__get_state(x)
+
+    def __step(self, A_in, x):
         """Realize a time step of the process
         """
-        new_infected_node_set = self.infected_node_set.copy()
-        #look for new infections
-        for node in self.infected_node_set:
-            #try to infect neighbors
-            for neighbor in G.neighbors(node):
-                if random() < self.p:
-                    new_infected_node_set.add(neighbor)
-
-        #look for recuperations
-        for node in self.infected_node_set:
-            #try to recuperate
-            if random() < self.q:
-                new_infected_node_set.remove(node)
-        #set new infected nodes
-        self.infected_node_set = new_infected_node_set
-
-    def __get_state(self, G):
-        """Returns the current state"""
-        x = np.zeros(len(G))
-        for node in self.infected_node_set:
-            x[node] = 1
+        #number of infected neighbors of each node
+        k = (A_in @ x.T.astype(np.float64)).T
+        r = self.rng.random(x.shape)
 
+        #infected nodes recuperate with probability q, the others are
+        #infected by at least one of their k infected neighbors
+        return np.where(x, r >= self.q, r < 1.0 - (1.0 - self.p)**k)
+
+    def __get_state(self, x):
+        """Returns the current state"""
         # Random activation
         if self.self_activation>0:
-            rdm_act = np.random.choice([0,1], size=len(x), p=[1-self.self_activation, self.self_activation])
-            x = np.minimum(x+rdm_act, 1)
+            rdm_act = self.rng.random(x.shape) < self.self_activation
+            return x | rdm_act
         return x
-
-
-
-
@@ -0,0 +1,125 @@
+import itertools
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+import numpy as np
+import scipy.sparse
+
+from .base import _csr_adjacency
+from ..utils.rng import spawn_seeds
+
+__all__ = [
+    'parameter_sweep',
+]
+
+
+# Adjacency matrix attached from shared memory in each worker.
+_worker_adjacency = None
+_worker_blocks = []
+
+
+def _share_array(array):
+    """Copies ``array`` into a new shared memory block."""
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[:] = array
+    return block, (block.name, array.shape, array.dtype.str)
+
+
+def _init_worker(shape, specs):
+    """Rebuilds the CSR adjacency on top of the shared memory blocks, without copy."""
+    global _worker_adjacency, _worker_blocks
+    arrays = []
+    for name, array_shape, dtype in specs:
+        block = shared_memory.SharedMemory(name=name)
+        _worker_blocks.append(block)
+        arrays.append(np.ndarray(array_shape, dtype=dtype, buffer=block.buf))
+    data, indices, indptr = arrays
+    _worker_adjacency = scipy.sparse.csr_matrix((data, indices, indptr), shape=shape, copy=False)
+
+
+def _run_task(dynamics_class, params, T, x0, n_runs, seed):
+    dynamics = dynamics_class(seed=seed, **params)
+    if n_runs is None:
+        return dynamics(_worker_adjacency, T, x0)
+    return dynamics.simulate_ensemble(_worker_adjacency, T, n_runs, x0)
+
+
+def parameter_sweep(dynamics_class, G, param_grid, T, x0=None, n_runs=None, max_workers=None, seed=None):
+    """Runs a dynamics for every combination of parameters of a grid in a pool of processes.
+
+    The weighted adjacency matrix of ``G`` is placed once in shared memory and
+    every worker reads it from there, the graph is never pickled. Each point of
+    the grid gets its own random seed spawned from ``seed``, so the results do
+    not depend on the number of workers nor on the order of completion.
+
+    **Parameters**
+
+    dynamics_class : class
+        Subclass of ``BaseDynamics``, for instance ``SISDynamics``. It is instantiated
+        in the workers as ``dynamics_class(seed=seed, **params)``.
+
+    G : nx.Graph or scipy.sparse matrix
+        Graph structure shared by all the runs.
+
+    param_grid : dict
+        Dictionary mapping each parameter name to the list of values to explore.
+        All the combinations are run.
+
+    T : list
+        List of times.
+
+    x0 : np.array(N) : (default=None)
+        Initial state used for all the runs. If None, each run builds its own.
+
+    n_runs : int : (default=None)
+        If not None, ``simulate_ensemble`` is called with ``n_runs`` realizations
+        for each point of the grid.
+
+    max_workers : int : (default=None)
+        Number of processes. If None, the number of processors is used.
+
+    seed : int, np.random.SeedSequence or np.random.Generator : (default=None)
+        Root seed of the sweep.
+
+    **Returns**
+
+    generator
+        Yields ``(params, X)`` as soon as each run is finished, where ``params``
+        is a dictionary of the parameters and ``X`` the output of the dynamics.
+
+    **Example**
+
+    .. code:: python
+
+        import networkx as nx
+        import numpy as np
+        import dynamicalab.dynamics as dyn
+
+        G = nx.erdos_renyi_graph(1000, 0.01)
+        grid = {"p": [0.01, 0.05, 0.1], "q": [0.1, 0.5]}
+        for params, X in dyn.parameter_sweep(dyn.SISDynamics, G, grid, np.arange(100), seed=42):
+            print(params, X.mean())
+
+    """
+    names = list(param_grid.keys())
+    grid = [dict(zip(names, values)) for values in itertools.product(*param_grid.values())]
+    seeds = spawn_seeds(seed, len(grid))
+
+    A = _csr_adjacency(G, weight="weight")
+    blocks, specs = zip(*[_share_array(array) for array in (A.data, A.indices, A.indptr)])
+
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(A.shape, specs)) as executor:
+            futures = {executor.submit(_run_task, dynamics_class, params, T, x0, n_runs, task_seed): params
+                       for params, task_seed in zip(grid, seeds)}
+            try:
+                for future in as_completed(futures):
+                    yield futures[future], future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
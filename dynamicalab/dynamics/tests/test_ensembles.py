@@ -0,0 +1,37 @@
+import networkx as nx
+import numpy as np
+
+import dynamicalab.dynamics as dyn
+
+
+def test_theta_model_large_ensemble():
+    G = nx.erdos_renyi_graph(300, 0.02, seed=1)
+    T = np.linspace(0, 2, 5)
+    n_runs = 300
+    x0 = np.random.default_rng(0).uniform(0, 2*np.pi, size=(n_runs, 300))
+    for integrator in ("odeint", "LSODA", "RK45", "rk4"):
+        dynamics = dyn.ThetaModelDynamics(integrator=integrator, dt=0.01)
+        X = dynamics.simulate_ensemble(G, T, n_runs, x0)
+        assert X.shape == (n_runs, len(T), 300)
+        for run in (0, n_runs - 1):
+            assert np.allclose(X[run], dynamics(G, T, x0[run]), atol=1e-5)
+
+
+def test_empty_ensembles():
+    G = nx.path_graph(6)
+    T = np.arange(4)
+    for dynamics in (dyn.SISDynamics(0.1, 0.2, seed=0), dyn.SISDynamics(0.1, 0.2, state_format="packed", seed=0),
+                     dyn.BernoulliDynamics(0.5, seed=0), dyn.ThetaModelDynamics(seed=0)):
+        assert dynamics.simulate_ensemble(G, T, 0).shape == (0, len(T), 6)
+
+
+def test_bernoulli_ensemble_formats():
+    G = nx.path_graph(21)
+    T = np.arange(2500)
+    X = dyn.BernoulliDynamics(0.3, seed=4).simulate_ensemble(G, T, 3)
+    packed = dyn.BernoulliDynamics(0.3, state_format="packed", seed=4).simulate_ensemble(G, T, 3)
+    assert packed.packed.shape == (3, len(T), 3)
+    assert np.array_equal(packed.unpack(np.float64), X)
+    # The realizations follow each other in the random stream, as consecutive calls.
+    dynamics = dyn.BernoulliDynamics(0.3, seed=4)
+    assert np.array_equal(np.array([dynamics(G, T) for run in range(3)]), X)
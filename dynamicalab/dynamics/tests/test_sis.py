@@ -0,0 +1,93 @@
+import os
+import random
+import shutil
+import tempfile
+
+import networkx as nx
+import numpy as np
+
+import dynamicalab.dynamics as dyn
+
+
+def _reference_prevalence(G, p, q, self_activation, T, x0, seed):
+    """Prevalence of the first implementation of ``SISDynamics``, with a set of infected nodes."""
+    rng = random.Random(seed)
+    infected = {node for node in G.nodes() if x0[node] == 1}
+    prevalence = []
+    for t in T:
+        new_infected = set(infected)
+        for node in infected:
+            for neighbor in G.neighbors(node):
+                if rng.random() < p:
+                    new_infected.add(neighbor)
+        for node in infected:
+            if rng.random() < q:
+                new_infected.remove(node)
+        infected = new_infected
+
+        x = np.zeros(len(G))
+        x[list(infected)] = 1
+        if self_activation > 0:
+            x = np.maximum(x, np.array([rng.random() < self_activation for _ in range(len(G))]))
+        prevalence.append(x.mean())
+    return np.array(prevalence)
+
+
+def test_prevalence_matches_reference():
+    T = np.arange(40)
+    n_runs = 200
+    for directed in (False, True):
+        # The first nodes are hubs, infected at first, so that the direction of the edges matters.
+        G = nx.gnp_random_graph(100, 0.03, seed=3, directed=directed)
+        G.add_edges_from((i, j) for i in range(5) for j in range(5, 100))
+        x0 = np.zeros(100, dtype=int)
+        x0[:5] = 1
+        for self_activation in (0, 0.05):
+            expected = np.mean([_reference_prevalence(G, 0.05, 0.2, self_activation, T, x0, seed)
+                                for seed in range(n_runs)], axis=0)
+            dynamics = dyn.SISDynamics(0.05, 0.2, self_activation=self_activation, seed=1)
+            prevalence = dynamics.simulate_ensemble(G, T, n_runs, x0).mean(axis=(0, 2))
+            assert np.abs(prevalence - expected).max() < 0.03, (directed, self_activation)
+            assert np.abs(prevalence[20:].mean() - expected[20:].mean()) < 0.01, (directed, self_activation)
+
+
+def _dynamics(seed):
+    yield dyn.SISDynamics(0.1, 0.2, self_activation=0.01, seed=seed)
+    yield dyn.SISDynamics(0.1, 0.2, state_format="bool", seed=seed)
+    yield dyn.SISDynamics(0.1, 0.2, state_format="packed", seed=seed)
+    yield dyn.BernoulliDynamics(0.3, seed=seed)
+    yield dyn.BernoulliDynamics(0.3, state_format="packed", seed=seed)
+    yield dyn.ThetaModelDynamics(seed=seed)
+    yield dyn.ThetaModelDynamics(integrator="rk4", dt=0.05, seed=seed)
+
+
+def _unpacked(X):
+    return X.unpack(np.float64) if isinstance(X, dyn.PackedStates) else np.asarray(X, dtype=np.float64)
+
+
+def test_outputs_agree_with_call():
+    G = nx.gnp_random_graph(30, 0.2, seed=1, directed=True)
+    T = np.linspace(0, 5, 23)
+    directory = tempfile.mkdtemp()
+    try:
+        for i, (reference, chunked, written, reduced) in enumerate(zip(*(_dynamics(7) for _ in range(4)))):
+            X = _unpacked(reference(G, T))
+            # The ODE solvers restart at each chunk, with the same tolerance.
+            atol = 1e-5 if isinstance(reference, dyn.ThetaModelDynamics) else 0
+
+            chunks = list(chunked.iter_states(G, T, chunk_size=5))
+            assert [len(chunk) for chunk in chunks] == [5, 5, 5, 5, 3]
+            assert np.allclose(np.concatenate([_unpacked(chunk) for chunk in chunks]), X, atol=atol)
+
+            path = os.path.join(directory, "states_{}.npy".format(i))
+            written.write_states(G, T, path, chunk_size=4)
+            out = np.load(path)
+            if getattr(reference, "state_format", None) == "packed":
+                out = dyn.PackedStates(out, 30)
+            assert np.allclose(_unpacked(out), X, atol=atol)
+
+            results = reduced(G, T, reducers=[dyn.Prevalence(), dyn.TimeAverage()])
+            assert np.allclose(results["prevalence"], X.mean(axis=1), atol=atol)
+            assert np.allclose(results["time_average"], X.mean(axis=0), atol=atol)
+    finally:
+        shutil.rmtree(directory)
@@ -1,9 +1,9 @@
 
-import networkx as nx
 import numpy as np
-from scipy.integrate import odeint
+import scipy.sparse
+from scipy.integrate import odeint, solve_ivp
 
-from .base import BaseDynamics
+from .base import BaseDynamics, _csr_adjacency, _number_of_nodes
 
 
 class ThetaModelDynamics(BaseDynamics):
@@ -20,8 +20,11 @@ class ThetaModelDynamics(BaseDynamics):
 	Since the activity is interpreted as an angle, it is typical to take the
 	cosinus of the activity.
 
+	The coupling matrix is kept as a ``scipy.sparse`` CSR matrix, so the memory and
+	the cost of each evaluation of the right-hand side are linear in the number of edges.
+
 	"""
-	def __init__(self, sigma=0.1, input_intensity=0.5, cos_transform=True):
+	def __init__(self, sigma=0.1, input_intensity=0.5, cos_transform=True, integrator="odeint", dt=None, noise=0, seed=None, rtol=1.49012e-8, atol=1.49012e-8):
 		"""Initialization.
 
 		**Parameters**
@@ -34,39 +37,194 @@ class ThetaModelDynamics(BaseDynamics):
 		cos_transform : Bool : (default=True)
 			If true, take the cosinus of the activity as output.
 
+		integrator : String : (default="odeint")
+			Integration scheme. Either ``"odeint"`` or one of the methods of
+			``scipy.integrate.solve_ivp`` (``"RK45"``, ``"RK23"``, ``"DOP853"``, ``"Radau"``,
+			``"BDF"``, ``"LSODA"``). The stiff methods ``"Radau"`` and ``"BDF"`` receive the
+			sparse Jacobian of the system. Note that ``"odeint"`` and ``"LSODA"`` allocate a dense
+			Jacobian of size ``N^2``, so the explicit methods (e.g. ``"RK45"``) should be
+			preferred for large graphs.
+
+			The fixed-step schemes ``"euler"`` (Euler–Maruyama if ``noise>0``) and ``"rk4"``
+			work in preallocated buffers, only the sparse product allocates its result at each step.
+
+		dt : Float : (default=None)
+			Time step of the fixed-step schemes. If None, one step is made between
+			each consecutive times of ``T``.
+
+		noise : Float : (default=0)
+			Intensity of the white noise added to each node by the ``"euler"`` scheme.
+
+		seed : int, np.random.SeedSequence or np.random.Generator : (default=None)
+			Seed of the random number generator.
+
+		rtol, atol : Float : (default=1.49012e-8)
+			Relative and absolute tolerances of ``odeint`` and of the ``solve_ivp`` methods. The
+			defaults are those of ``odeint``; the defaults of ``solve_ivp`` are much looser.
+
 		"""
-		super(ThetaModelDynamics, self).__init__()
+		super(ThetaModelDynamics, self).__init__(seed)
 		self.sigma = sigma
 		self.I = input_intensity
 		self.cos_transform = cos_transform
+		if integrator not in ["odeint", "RK45", "RK23", "DOP853", "Radau", "BDF", "LSODA", "euler", "rk4"]:
+			raise ValueError("Unknown integrator %s." % integrator)
+		if noise > 0 and integrator != "euler":
+			raise ValueError("Noise is only supported by the euler integrator.")
+		self.integrator = integrator
+		self.dt = dt
+		self.noise = noise
+		self.rtol = rtol
+		self.atol = atol
 		return
 	
 	def best_x0(self, G):
 		"""Random numbers between 0 and ``2*np.pi``
 		"""
-		return np.random.uniform(0,2*np.pi, size=(G.number_of_nodes(),))
+		return self.rng.uniform(0,2*np.pi, size=(_number_of_nodes(G),))
 	
-	def __call__(self, G, T, x0=None):
+	def __call__(self, G, T, x0=None, reducers=None):
+
+		if reducers is not None:
+			return self._reduce(G, T, x0, reducers)
 
 		if x0 is None:
 			x0 = self.best_x0(G)
-		
-		W = nx.to_numpy_array(G)
-		N = G.number_of_nodes()
 
-		dt = T[1]-T[0]
+		X = self.__integrate(self.__coupling(G), T, np.asarray(x0, dtype=np.float64))
+		return self.__output(X)
 
-		def ode(x, T, W):
+	def simulate_ensemble(self, G, T, n_runs, x0=None):
+		"""With the fixed-step schemes and the explicit methods of ``solve_ivp``, all the realizations
+		are integrated together as a single system of ``n_runs*N`` oscillators.
 
-			net = self.I + self.sigma/N * (W @ (1-np.cos(x)))
-			dydt = (1-np.cos(x)) + (1+np.cos(x))*net
-			return dydt
-		
-		X = odeint(ode, x0, T, args=(W.copy(), ))
+		The other integrators use a Jacobian of the whole system, dense for ``"odeint"`` and ``"LSODA"``,
+		so the realizations are integrated one after the other.
+		"""
+		if self.integrator not in ["euler", "rk4", "RK45", "RK23", "DOP853"]:
+			return super(ThetaModelDynamics, self).simulate_ensemble(G, T, n_runs, x0)
+
+		X0 = self._ensemble_x0(G, n_runs, x0).astype(np.float64)
+
+		X = self.__integrate(self.__coupling(G), T, X0)
+		return self.__output(X).transpose(1, 0, 2)
 
+	def iter_states(self, G, T, x0=None, chunk_size=1000):
+		"""Generates the states by chunks, see ``BaseDynamics.iter_states``.
+
+		Each chunk is integrated from the last state of the previous one.
+		"""
+		if x0 is None:
+			x0 = self.best_x0(G)
+
+		W = self.__coupling(G)
+		T = np.asarray(T)
+		x = np.asarray(x0, dtype=np.float64)
+		for start in range(0, len(T), chunk_size):
+			stop = min(start + chunk_size, len(T))
+			if start == 0:
+				X = self.__integrate(W, T[:stop], x)
+			else:
+				X = self.__integrate(W, T[start-1:stop], x)[1:]
+			x = X[-1]
+			yield self.__output(X)
+
+	def __coupling(self, G):
+		"""Sparse coupling matrix ``sigma/N * W``."""
+		N = _number_of_nodes(G)
+		return _csr_adjacency(G, weight="weight").astype(np.float64) * (self.sigma/N)
+
+	def __output(self, X):
 		if self.cos_transform:
 			return np.cos(X)
 
 		return X
-		
-	
\ No newline at end of file
+
+	def __integrate(self, W, T, x0):
+		"""Integrates from ``x0`` of shape ``(N,)`` or ``(n_runs, N)``.
+		The output has shape ``(len(T),) + x0.shape``.
+		"""
+		N = W.shape[0]
+
+		def ode(t, x):
+			x = x.reshape(x0.shape)
+			net = self.I + (W @ (1-np.cos(x)).T).T
+			dydt = (1-np.cos(x)) + (1+np.cos(x))*net
+			return dydt.ravel()
+
+		def jacobian(t, x):
+			x = x.reshape((-1, N))
+			blocks = []
+			for x_run in x:
+				net = self.I + W @ (1-np.cos(x_run))
+				J = scipy.sparse.diags(1+np.cos(x_run)) @ W @ scipy.sparse.diags(np.sin(x_run))
+				blocks.append(J + scipy.sparse.diags(np.sin(x_run)*(1-net)))
+			return scipy.sparse.block_diag(blocks, format="csc")
+
+		if self.integrator in ["euler", "rk4"]:
+			X = self.__fixed_step(W, T, x0)
+		elif self.integrator == "odeint":
+			X = odeint(ode, x0.ravel(), T, tfirst=True, rtol=self.rtol, atol=self.atol)
+		else:
+			options = {"jac": jacobian} if self.integrator in ["Radau", "BDF"] else {}
+			sol = solve_ivp(ode, (T[0], T[-1]), x0.ravel(), method=self.integrator, t_eval=T,
+							rtol=self.rtol, atol=self.atol, **options)
+			if not sol.success:
+				raise RuntimeError(sol.message)
+			X = sol.y.T
+		return X.reshape((len(T),) + x0.shape)
+
+	def __fixed_step(self, W, T, x0):
+		"""Fixed-step integration. The state is stored as a ``(N, n_runs)`` array
+		so that the coupling of all the runs is a single sparse product.
+		"""
+		N = W.shape[0]
+		x = np.array(x0.reshape((-1, N)).T, order="C")
+		X = np.empty((len(T),) + x0.shape)
+		X_runs = X.reshape((len(T), -1, N))
+		X_runs[0] = x.T
+
+		c, one_minus_c, net, k, acc, tmp = [np.empty_like(x) for i in range(6)]
+
+		def rhs(x, out):
+			np.cos(x, out=c)
+			np.subtract(1, c, out=one_minus_c)
+			np.add(W @ one_minus_c, self.I, out=net)
+			np.add(1, c, out=c)
+			np.multiply(c, net, out=out)
+			out += one_minus_c
+
+		for t in range(1, len(T)):
+			n_steps = 1 if self.dt is None else max(int(np.ceil((T[t]-T[t-1])/self.dt)), 1)
+			h = (T[t]-T[t-1])/n_steps
+			for step in range(n_steps):
+				if self.integrator == "euler":
+					rhs(x, k)
+					k *= h
+					x += k
+					if self.noise > 0:
+						self.rng.standard_normal(out=tmp)
+						tmp *= self.noise*np.sqrt(h)
+						x += tmp
+				else:
+					rhs(x, k)
+					np.copyto(acc, k)
+					np.multiply(k, h/2, out=tmp)
+					tmp += x
+					rhs(tmp, k)
+					acc += k
+					acc += k
+					np.multiply(k, h/2, out=tmp)
+					tmp += x
+					rhs(tmp, k)
+					acc += k
+					acc += k
+					np.multiply(k, h, out=tmp)
+					tmp += x
+					rhs(tmp, k)
+					acc += k
+					acc *= h/6
+					x += acc
+			X_runs[t] = x.T
+
+		return X
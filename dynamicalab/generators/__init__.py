@@ -1,5 +1,6 @@
 
 from .kernel import *
+from .random_graphs import *
 from .bipartites import *
 from .foodwebs import *
 from .connectomes import *
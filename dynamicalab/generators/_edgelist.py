@@ -0,0 +1,53 @@
+import networkx as nx
+import numpy as np
+import scipy.sparse
+
+
+RETURN_TYPES = ["networkx", "edgelist", "csr"]
+
+
+def check_return_type(return_type):
+	if return_type not in RETURN_TYPES:
+		raise ValueError("return_type must be one of %s." % ", ".join(RETURN_TYPES))
+	return return_type
+
+
+def format_edges(edges, N, directed, return_type):
+	"""Converts an array of edges of shape ``(M, 2)`` to the requested output.
+
+	**Parameters**
+
+	edges : np.array(M, 2)
+		Edges, possibly repeated. For undirected graphs the orientation is ignored.
+
+	N : int
+		Number of nodes, labeled from ``0`` to ``N-1``.
+
+	directed : bool
+		If true, ``edges`` are directed.
+
+	return_type : String
+		``"networkx"`` for a ``nx.Graph`` or ``nx.DiGraph``, ``"edgelist"`` for the array of
+		unique edges (each undirected edge once, as ``(i, j)`` with ``i <= j``) or ``"csr"`` for
+		a binary ``scipy.sparse.csr_matrix`` adjacency matrix.
+
+	"""
+	if return_type == "networkx":
+		G = nx.DiGraph() if directed else nx.Graph()
+		G.add_nodes_from(range(N))
+		G.add_edges_from(edges.tolist())
+		return G
+
+	if not directed:
+		edges = np.sort(edges, axis=1)
+	edges = np.unique(edges, axis=0)
+
+	if return_type == "edgelist":
+		return edges
+
+	rows, cols = edges[:, 0], edges[:, 1]
+	if not directed:
+		off_diagonal = rows != cols
+		rows, cols = np.concatenate([rows, cols[off_diagonal]]), np.concatenate([cols, rows[off_diagonal]])
+	A = scipy.sparse.csr_matrix((np.ones(len(rows), dtype=np.int8), (rows, cols)), shape=(N, N))
+	return A
@@ -0,0 +1,45 @@
+
+class FenwickTree(object):
+	"""Binary indexed tree over non-negative weights.
+
+	Updating a weight and sampling an index proportionally to the weights both
+	cost O(log n).
+	"""
+
+	def __init__(self, n):
+		self.n = n
+		self.weights = [0.0]*n
+		self.tree = [0.0]*(n+1)
+		self.total = 0.0
+		self._high_bit = 1 << (n.bit_length()-1) if n > 0 else 0
+
+	def update(self, i, weight):
+		"""Sets the weight of index ``i``."""
+		delta = weight - self.weights[i]
+		self.weights[i] = weight
+		self.total += delta
+		i += 1
+		while i <= self.n:
+			self.tree[i] += delta
+			i += i & -i
+
+	def find(self, u):
+		"""Returns the index ``i`` such that the cumulative weight up to ``i`` first exceeds ``u``."""
+		tree = self.tree
+		pos = 0
+		step = self._high_bit
+		while step:
+			if pos + step <= self.n and tree[pos + step] <= u:
+				pos += step
+				u -= tree[pos]
+			step >>= 1
+
+		# Guards against rounding errors accumulated in the partial sums.
+		pos = min(pos, self.n - 1)
+		while self.weights[pos] == 0 and pos > 0:
+			pos -= 1
+		return pos
+
+	def sample(self, u):
+		"""Samples an index proportionally to the weights from a uniform number ``u`` in [0,1)."""
+		return self.find(u*self.total)
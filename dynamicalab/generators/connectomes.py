@@ -1,4 +1,4 @@
-from dynamicalab import Dataset
+from dynamicalab.classes._registry import registry
 
 def connectomes(save_path):
 	"""Iterator through all connectomes datasets.
@@ -17,19 +17,11 @@ def connectomes(save_path):
 
 	.. note:: 
 
-		It loads all methods of ``Dynamicalab`` for which the name contains ``connectomes_``. 
-		Therefore, the name convention must be enforced.
+		The datasets are listed in the manifest ``dynamicalab/classes/datasets.json``, see ``DatasetRegistry``.
+		Each ``Dataset`` is only created when the iterator reaches it.
 
 	"""
-	import dynamicalab as dlb
-	index = 0
-	methods = dir(dlb)
-	pp_methods = [getattr(dlb,method) for method in methods if ("connectomes_" in method)]
-	datasets = [method(save_path) for method in pp_methods]
-
-	while index < len(datasets):
-		yield datasets[index]
-		index += 1
+	return registry.datasets(save_path, collection="connectomes")
 
 
 def connectomes_CElegansSNAP(save_path="./data"):    
@@ -50,17 +42,4 @@ def connectomes_CElegansSNAP(save_path="./data"):
 		Object dataset. Use ``dataset.graph()`` to download the graph.
 	
 	"""
-	url = "https://snap.stanford.edu/data/C-elegans-frontal.txt.gz"
-	data_type = "edgelist_directed"
-	data_name = "C-elegans-frontal.txt.gz"
-	compress_type = None
-	infos = {
-		"type" : data_type,
-		"download_url" : url,
-		"info_url": "http://www-personal.umich.edu/~mejn/netdata/",
-		"description" : "This is a neural network of neurons and synapses in C. elegans, a type of worm. This dataset also includes two-dimensional spatial positions of the rostral ganglia neurons.",
-		"source" : 'Marcus Kaiser and Claus C. Hilgetag. "Nonoptimal component placement, but short processing paths, due to long-distance projections in neural systems." PLoS Comput Biol 2.7 (2006): e95.'	
-		}
-
-	data = Dataset(url, save_path, data_type, data_name, compress_type, infos)
-	return data
\ No newline at end of file
+	return registry.dataset("connectomes_CElegansSNAP", save_path)
\ No newline at end of file
@@ -1,5 +1,5 @@
 
-from dynamicalab import Dataset
+from dynamicalab.classes._registry import registry
 
 def food_webs(save_path):
 	"""Iterator through all food webs datasets.
@@ -18,19 +18,11 @@ def food_webs(save_path):
 
 	.. note:: 
 
-		It loads all methods of ``Dynamicalab`` for which the name contains ``foodwebs_``. 
-		Therefore, the name convention must be enforced.
+		The datasets are listed in the manifest ``dynamicalab/classes/datasets.json``, see ``DatasetRegistry``.
+		Each ``Dataset`` is only created when the iterator reaches it.
 
 	"""
-	import dynamicalab as dlb
-	index = 0
-	methods = dir(dlb)
-	pp_methods = [getattr(dlb,method) for method in methods if ("food_webs_" in method)]
-	datasets = [method(save_path) for method in pp_methods]
-
-	while index < len(datasets):
-		yield datasets[index]
-		index += 1
+	return registry.datasets(save_path, collection="food_webs")
 
 
 def food_webs_Angelini_Agostinho_2005(save_path='./data'):    
@@ -59,19 +51,7 @@ def food_webs_Angelini_Agostinho_2005(save_path='./data'):
     
     
     """
-    url = 'http://www.web-of-life.es/networkjson.php?id=FW_001'
-    data_type = 'weboflife_foodwebs_json'
-    data_name = 'networkjson.php?id=FW_001'
-    compress_type = None
-    infos = {
-         'type': data_type,
-         'download_url' : url,
-        'info_url': 'http://www.web-of-life.es/map.php?type=7',
-        'source' :  'Angelini, R., Agostinho A. (2005) Food web model of the Upper Paran ́a River Floodplain: description and aggregation effects. Ecological Modelling 181: 109–121'
-    }
-
-    data = Dataset(url, save_path, data_type, data_name, compress_type, infos)
-    return data
+    return registry.dataset("food_webs_Angelini_Agostinho_2005", save_path)
     
 
 def food_webs_Angelini_et_all_1011(save_path='./data'):    
@@ -100,19 +80,7 @@ def food_webs_Angelini_et_all_1011(save_path='./data'):
     
     
     """
-    url = 'http://www.web-of-life.es/networkjson.php?id=FW_002'
-    data_type = 'weboflife_foodwebs_json'
-    data_name = 'networkjson.php?id=FW_002'
-    compress_type = None
-    infos = {
-         'type': data_type,
-         'download_url' : url,
-        'info_url': 'http://www.web-of-life.es/map.php?type=7',
-        'source' :  'Angelini, R., Aloisio, GR., Carvalho, AR. (2011) Mixed food web control and stability in a Cerrado river (Brazil). Pan-American Journal of Aquatic Sciences 5(3):421-431'
-    }
-
-    data = Dataset(url, save_path, data_type, data_name, compress_type, infos)
-    return data
+    return registry.dataset("food_webs_Angelini_et_all_1011", save_path)
     
 
 def food_webs_Angelini_Velho_2011(save_path='./data'):    
@@ -141,19 +109,7 @@ def food_webs_Angelini_Velho_2011(save_path='./data'):
     
     
     """
-    url = 'http://www.web-of-life.es/networkjson.php?id=FW_003'
-    data_type = 'weboflife_foodwebs_json'
-    data_name = 'networkjson.php?id=FW_003'
-    compress_type = None
-    infos = {
-         'type': data_type,
-         'download_url' : url,
-        'info_url': 'http://www.web-of-life.es/map.php?type=7',
-        'source' :  'Angelini, R., Velho, VF. (2011) Ecosystem structure and trophic analysis of Angolan fishery landings. Scientia Marina 75(2)'
-    }
-
-    data = Dataset(url, save_path, data_type, data_name, compress_type, infos)
-    return data
+    return registry.dataset("food_webs_Angelini_Velho_2011", save_path)
     
 
 def food_webs_Angelini_et_all_2006(save_path='./data'):    
@@ -182,19 +138,7 @@ def food_webs_Angelini_et_all_2006(save_path='./data'):
     
     
     """
-    url = 'http://www.web-of-life.es/networkjson.php?id=FW_004'
-    data_type = 'weboflife_foodwebs_json'
-    data_name = 'networkjson.php?id=FW_004'
-    compress_type = None
-    infos = {
-         'type': data_type,
-         'download_url' : url,
-        'info_url': 'http://www.web-of-life.es/map.php?type=7',
-        'source' :  'Angelini, R,. Agostinho A,. Carlos LG. (2006) Modeling energy flow in a large Neotropical Reservoir: a tool do evaluate fishing and stability. Neotrop. Ichthyol., 4(2):253-260, 2006'
-    }
-
-    data = Dataset(url, save_path, data_type, data_name, compress_type, infos)
-    return data
+    return registry.dataset("food_webs_Angelini_et_all_2006", save_path)
     
 
 def food_webs_Torres_et_all_2013(save_path='./data'):    
@@ -223,19 +167,7 @@ def food_webs_Torres_et_all_2013(save_path='./data'):
     
     
     """
-    url = 'http://www.web-of-life.es/networkjson.php?id=FW_005'
-    data_type = 'weboflife_foodwebs_json'
-    data_name = 'networkjson.php?id=FW_005'
-    compress_type = None
-    infos = {
-         'type': data_type,
-         'download_url' : url,
-        'info_url': 'http://www.web-of-life.es/map.php?type=7',
-        'source' :  'Torres MA., Coll M., Heymans JJ., Christensen V,. Sobrino I. (2013) Food-web structure of and fishing impacts on the Gulf of Cadiz ecosystem (South-western Spain). Ecological Modelling 265 (2013) 26–44'
-    }
-
-    data = Dataset(url, save_path, data_type, data_name, compress_type, infos)
-    return data
+    return registry.dataset("food_webs_Torres_et_all_2013", save_path)
     
 
 def food_webs_Escalona_et_all_2007(save_path='./data'):    
@@ -264,19 +196,7 @@ def food_webs_Escalona_et_all_2007(save_path='./data'):
     
     
     """
-    url = 'http://www.web-of-life.es/networkjson.php?id=FW_006'
-    data_type = 'weboflife_foodwebs_json'
-    data_name = 'networkjson.php?id=FW_006'
-    compress_type = None
-    infos = {
-         'type': data_type,
-         'download_url' : url,
-        'info_url': 'http://www.web-of-life.es/map.php?type=7',
-        'source' :  'Cruz-Escalona, V.H., Arrequin-Sanchez, F., Zetina-Rejon, M. (2007)  Analysis of the ecosystem structure of Laguna Alvarado, western Gulf of Mexico, by means of a mass balance model. Estuarine, Coastal and Shelf Science 72 (155-167)'
-    }
-
-    data = Dataset(url, save_path, data_type, data_name, compress_type, infos)
-    return data
+    return registry.dataset("food_webs_Escalona_et_all_2007", save_path)
     
 
 def food_webs_Christian_Luczkovich_1999(save_path='./data'):    
@@ -305,19 +225,7 @@ def food_webs_Christian_Luczkovich_1999(save_path='./data'):
     
     
     """
-    url = 'http://www.web-of-life.es/networkjson.php?id=FW_007'
-    data_type = 'weboflife_foodwebs_json'
-    data_name = 'networkjson.php?id=FW_007'
-    compress_type = None
-    infos = {
-         'type': data_type,
-         'download_url' : url,
-        'info_url': 'http://www.web-of-life.es/map.php?type=7',
-        'source' :  'Christian, RR., Luczkovich JJ. (1999) Organizing and understanding a winter’s seagrass foodweb network through effective trophic levels'
-    }
-
-    data = Dataset(url, save_path, data_type, data_name, compress_type, infos)
-    return data
+    return registry.dataset("food_webs_Christian_Luczkovich_1999", save_path)
     
 
 def food_webs_Bascompte_et_all_2005(save_path='./data'):    
@@ -346,19 +254,7 @@ def food_webs_Bascompte_et_all_2005(save_path='./data'):
     
     
     """
-    url = 'http://www.web-of-life.es/networkjson.php?id=FW_008'
-    data_type = 'weboflife_foodwebs_json'
-    data_name = 'networkjson.php?id=FW_008'
-    compress_type = None
-    infos = {
-         'type': data_type,
-         'download_url' : url,
-        'info_url': 'http://www.web-of-life.es/map.php?type=7',
-        'source' :  'J. Bascompte, C. J. Melián and E. Sala (2005). Interaction strength combinations and the overfishing of a marine food web. Proceedings of the National Academy of Sciences USA, 102: 5443-5447. '
-    }
-
-    data = Dataset(url, save_path, data_type, data_name, compress_type, infos)
-    return data
+    return registry.dataset("food_webs_Bascompte_et_all_2005", save_path)
     
 
 def food_webs_Angelini_et_all_2013(save_path='./data'):    
@@ -387,19 +283,7 @@ def food_webs_Angelini_et_all_2013(save_path='./data'):
     
     
     """
-    url = 'http://www.web-of-life.es/networkjson.php?id=FW_009'
-    data_type = 'weboflife_foodwebs_json'
-    data_name = 'networkjson.php?id=FW_009'
-    compress_type = None
-    infos = {
-         'type': data_type,
-         'download_url' : url,
-        'info_url': 'http://www.web-of-life.es/map.php?type=7',
-        'source' :  'Angelini, R., Morais, R., Catella AC., Resende KE., Libralato, S. (2013) Aquatic food webs of the oxbow lakes in the Pantanal: A new site for fisheries guaranteed by alternated control? Ecological Modelling 253 (82– 96)'
-    }
-
-    data = Dataset(url, save_path, data_type, data_name, compress_type, infos)
-    return data
+    return registry.dataset("food_webs_Angelini_et_all_2013", save_path)
     
 
 def food_webs_Angelini_et_all_2013(save_path='./data'):    
@@ -428,19 +312,7 @@ def food_webs_Angelini_et_all_2013(save_path='./data'):
     
     
     """
-    url = 'http://www.web-of-life.es/networkjson.php?id=FW_010'
-    data_type = 'weboflife_foodwebs_json'
-    data_name = 'networkjson.php?id=FW_010'
-    compress_type = None
-    infos = {
-         'type': data_type,
-         'download_url' : url,
-        'info_url': 'http://www.web-of-life.es/map.php?type=7',
-        'source' :  'Angelini, R., Morais, R., Catella AC., Resende KE., Libralato, S. (2013) Aquatic food webs of the oxbow lakes in the Pantanal: A new site for fisheries guaranteed by alternated control? Ecological Modelling 253 (82– 96)'
-    }
-
-    data = Dataset(url, save_path, data_type, data_name, compress_type, infos)
-    return data
+    return registry.dataset("food_webs_Angelini_et_all_2013", save_path)
     
 
 def food_webs_Thompson_and_Townsend_2003(save_path='./data'):    
@@ -469,19 +341,7 @@ def food_webs_Thompson_and_Townsend_2003(save_path='./data'):
     
     
     """
-    url = 'http://www.web-of-life.es/networkjson.php?id=FW_011'
-    data_type = 'weboflife_foodwebs_json'
-    data_name = 'networkjson.php?id=FW_011'
-    compress_type = None
-    infos = {
-         'type': data_type,
-         'download_url' : url,
-        'info_url': 'http://www.web-of-life.es/map.php?type=7',
-        'source' :  'Thompson, R., Townsend, C. (2003) IMPACTS ON STREAM FOOD WEBS OF NATIVE AND EXOTIC FOREST: AN INTERCONTINENTAL COMPARISON. Ecology, 84(1), pp. 145–161'
-    }
-
-    data = Dataset(url, save_path, data_type, data_name, compress_type, infos)
-    return data
+    return registry.dataset("food_webs_Thompson_and_Townsend_2003", save_path)
     
 
 def food_webs_Thompson_and_Townsend_2003_01(save_path='./data'):    
@@ -510,19 +370,7 @@ def food_webs_Thompson_and_Townsend_2003_01(save_path='./data'):
     
     
     """
-    url = 'http://www.web-of-life.es/networkjson.php?id=FW_012_01'
-    data_type = 'weboflife_foodwebs_json'
-    data_name = 'networkjson.php?id=FW_012_01'
-    compress_type = None
-    infos = {
-         'type': data_type,
-         'download_url' : url,
-        'info_url': 'http://www.web-of-life.es/map.php?type=7',
-        'source' :  'Thompson, R., Townsend, C. (2003) IMPACTS ON STREAM FOOD WEBS OF NATIVE AND EXOTIC FOREST: AN INTERCONTINENTAL COMPARISON. Ecology, 84(1), pp. 145–161'
-    }
-
-    data = Dataset(url, save_path, data_type, data_name, compress_type, infos)
-    return data
+    return registry.dataset("food_webs_Thompson_and_Townsend_2003_01", save_path)
     
 
 def food_webs_Thompson_and_Townsend_2003_02(save_path='./data'):    
@@ -551,19 +399,7 @@ def food_webs_Thompson_and_Townsend_2003_02(save_path='./data'):
     
     
     """
-    url = 'http://www.web-of-life.es/networkjson.php?id=FW_012_02'
-    data_type = 'weboflife_foodwebs_json'
-    data_name = 'networkjson.php?id=FW_012_02'
-    compress_type = None
-    infos = {
-         'type': data_type,
-         'download_url' : url,
-        'info_url': 'http://www.web-of-life.es/map.php?type=7',
-        'source' :  'Thompson, R., Townsend, C. (2003) IMPACTS ON STREAM FOOD WEBS OF NATIVE AND EXOTIC FOREST: AN INTERCONTINENTAL COMPARISON. Ecology, 84(1), pp. 145–161'
-    }
-
-    data = Dataset(url, save_path, data_type, data_name, compress_type, infos)
-    return data
+    return registry.dataset("food_webs_Thompson_and_Townsend_2003_02", save_path)
     
 
 def food_webs_Thompson_and_Townsend_2003_04(save_path='./data'):    
@@ -592,19 +428,7 @@ def food_webs_Thompson_and_Townsend_2003_04(save_path='./data'):
     
     
     """
-    url = 'http://www.web-of-life.es/networkjson.php?id=FW_013_02'
-    data_type = 'weboflife_foodwebs_json'
-    data_name = 'networkjson.php?id=FW_013_02'
-    compress_type = None
-    infos = {
-         'type': data_type,
-         'download_url' : url,
-        'info_url': 'http://www.web-of-life.es/map.php?type=7',
-        'source' :  'Thompson, R., Townsend, C. (2003) IMPACTS ON STREAM FOOD WEBS OF NATIVE AND EXOTIC FOREST: AN INTERCONTINENTAL COMPARISON. Ecology, 84(1), pp. 145–161'
-    }
-
-    data = Dataset(url, save_path, data_type, data_name, compress_type, infos)
-    return data
+    return registry.dataset("food_webs_Thompson_and_Townsend_2003_04", save_path)
     
 
 def food_webs_Thompson_and_Townsend_2003_05(save_path='./data'):    
@@ -633,19 +457,7 @@ def food_webs_Thompson_and_Townsend_2003_05(save_path='./data'):
     
     
     """
-    url = 'http://www.web-of-life.es/networkjson.php?id=FW_013_03'
-    data_type = 'weboflife_foodwebs_json'
-    data_name = 'networkjson.php?id=FW_013_03'
-    compress_type = None
-    infos = {
-         'type': data_type,
-         'download_url' : url,
-        'info_url': 'http://www.web-of-life.es/map.php?type=7',
-        'source' :  'Thompson, R., Townsend, C. (2003) IMPACTS ON STREAM FOOD WEBS OF NATIVE AND EXOTIC FOREST: AN INTERCONTINENTAL COMPARISON. Ecology, 84(1), pp. 145–161'
-    }
-
-    data = Dataset(url, save_path, data_type, data_name, compress_type, infos)
-    return data
+    return registry.dataset("food_webs_Thompson_and_Townsend_2003_05", save_path)
     
 
 def food_webs_Thompson_and_Townsend_2003_06(save_path='./data'):    
@@ -674,19 +486,7 @@ def food_webs_Thompson_and_Townsend_2003_06(save_path='./data'):
     
     
     """
-    url = 'http://www.web-of-life.es/networkjson.php?id=FW_013_04'
-    data_type = 'weboflife_foodwebs_json'
-    data_name = 'networkjson.php?id=FW_013_04'
-    compress_type = None
-    infos = {
-         'type': data_type,
-         'download_url' : url,
-        'info_url': 'http://www.web-of-life.es/map.php?type=7',
-        'source' :  'Thompson, R., Townsend, C. (2003) IMPACTS ON STREAM FOOD WEBS OF NATIVE AND EXOTIC FOREST: AN INTERCONTINENTAL COMPARISON. Ecology, 84(1), pp. 145–161'
-    }
-
-    data = Dataset(url, save_path, data_type, data_name, compress_type, infos)
-    return data
+    return registry.dataset("food_webs_Thompson_and_Townsend_2003_06", save_path)
     
 
 def food_webs_Thompson_and_Townsend_2003_07(save_path='./data'):    
@@ -715,19 +515,7 @@ def food_webs_Thompson_and_Townsend_2003_07(save_path='./data'):
     
     
     """
-    url = 'http://www.web-of-life.es/networkjson.php?id=FW_013_05'
-    data_type = 'weboflife_foodwebs_json'
-    data_name = 'networkjson.php?id=FW_013_05'
-    compress_type = None
-    infos = {
-         'type': data_type,
-         'download_url' : url,
-        'info_url': 'http://www.web-of-life.es/map.php?type=7',
-        'source' :  'Thompson, R., Townsend, C. (2003) IMPACTS ON STREAM FOOD WEBS OF NATIVE AND EXOTIC FOREST: AN INTERCONTINENTAL COMPARISON. Ecology, 84(1), pp. 145–161'
-    }
-
-    data = Dataset(url, save_path, data_type, data_name, compress_type, infos)
-    return data
+    return registry.dataset("food_webs_Thompson_and_Townsend_2003_07", save_path)
     
 
 def food_webs_Townsend_et_all_1998_01(save_path='./data'):    
@@ -756,19 +544,7 @@ def food_webs_Townsend_et_all_1998_01(save_path='./data'):
     
     
     """
-    url = 'http://www.web-of-life.es/networkjson.php?id=FW_014_01'
-    data_type = 'weboflife_foodwebs_json'
-    data_name = 'networkjson.php?id=FW_014_01'
-    compress_type = None
-    infos = {
-         'type': data_type,
-         'download_url' : url,
-        'info_url': 'http://www.web-of-life.es/map.php?type=7',
-        'source' :  'Townsend, R. Colin., Thompson, M. Ross., McInstosh, R. Angus., Kilroy, Cathy., Edwards, Eric., Scarsbrook, R. Mike. (1998) Disturbance, resource supply, and food-web architecture in streams. Ecology Letters 1: 200-109 '
-    }
-
-    data = Dataset(url, save_path, data_type, data_name, compress_type, infos)
-    return data
+    return registry.dataset("food_webs_Townsend_et_all_1998_01", save_path)
     
 
 def food_webs_Townsend_et_all_1998_02(save_path='./data'):    
@@ -797,19 +573,7 @@ def food_webs_Townsend_et_all_1998_02(save_path='./data'):
     
     
     """
-    url = 'http://www.web-of-life.es/networkjson.php?id=FW_014_02'
-    data_type = 'weboflife_foodwebs_json'
-    data_name = 'networkjson.php?id=FW_014_02'
-    compress_type = None
-    infos = {
-         'type': data_type,
-         'download_url' : url,
-        'info_url': 'http://www.web-of-life.es/map.php?type=7',
-        'source' :  'Townsend, R. Colin., Thompson, M. Ross., McInstosh, R. Angus., Kilroy, Cathy., Edwards, Eric., Scarsbrook, R. Mike. (1998) Disturbance, resource supply, and food-web architecture in streams. Ecology Letters 1: 200-109 '
-    }
-
-    data = Dataset(url, save_path, data_type, data_name, compress_type, infos)
-    return data
+    return registry.dataset("food_webs_Townsend_et_all_1998_02", save_path)
     
 
 def food_webs_Townsend_et_all_1998_03(save_path='./data'):    
@@ -838,19 +602,7 @@ def food_webs_Townsend_et_all_1998_03(save_path='./data'):
     
     
     """
-    url = 'http://www.web-of-life.es/networkjson.php?id=FW_014_03'
-    data_type = 'weboflife_foodwebs_json'
-    data_name = 'networkjson.php?id=FW_014_03'
-    compress_type = None
-    infos = {
-         'type': data_type,
-         'download_url' : url,
-        'info_url': 'http://www.web-of-life.es/map.php?type=7',
-        'source' :  'Townsend, R. Colin., Thompson, M. Ross., McInstosh, R. Angus., Kilroy, Cathy., Edwards, Eric., Scarsbrook, R. Mike. (1998) Disturbance, resource supply, and food-web architecture in streams. Ecology Letters 1: 200-109 '
-    }
-
-    data = Dataset(url, save_path, data_type, data_name, compress_type, infos)
-    return data
+    return registry.dataset("food_webs_Townsend_et_all_1998_03", save_path)
     
 
 def food_webs_Townsend_et_all_1998_04(save_path='./data'):    
@@ -879,19 +631,7 @@ def food_webs_Townsend_et_all_1998_04(save_path='./data'):
     
     
     """
-    url = 'http://www.web-of-life.es/networkjson.php?id=FW_014_04'
-    data_type = 'weboflife_foodwebs_json'
-    data_name = 'networkjson.php?id=FW_014_04'
-    compress_type = None
-    infos = {
-         'type': data_type,
-         'download_url' : url,
-        'info_url': 'http://www.web-of-life.es/map.php?type=7',
-        'source' :  'Townsend, R. Colin., Thompson, M. Ross., McInstosh, R. Angus., Kilroy, Cathy., Edwards, Eric., Scarsbrook, R. Mike. (1998) Disturbance, resource supply, and food-web architecture in streams. Ecology Letters 1: 200-109 '
-    }
-
-    data = Dataset(url, save_path, data_type, data_name, compress_type, infos)
-    return data
+    return registry.dataset("food_webs_Townsend_et_all_1998_04", save_path)
     
 
 def food_webs_Thompson_and_Townsend_2000_01(save_path='./data'):    
@@ -920,19 +660,7 @@ def food_webs_Thompson_and_Townsend_2000_01(save_path='./data'):
     
     
     """
-    url = 'http://www.web-of-life.es/networkjson.php?id=FW_015_01'
-    data_type = 'weboflife_foodwebs_json'
-    data_name = 'networkjson.php?id=FW_015_01'
-    compress_type = None
-    infos = {
-         'type': data_type,
-         'download_url' : url,
-        'info_url': 'http://www.web-of-life.es/map.php?type=7',
-        'source' :  'Thompson, R., Townsend, C. (2000) Is resolution the solution?: the effect of taxonomic resolution on the calculated properties of three stream food webs. Freshwater Biology  44, 413-422'
-    }
-
-    data = Dataset(url, save_path, data_type, data_name, compress_type, infos)
-    return data
+    return registry.dataset("food_webs_Thompson_and_Townsend_2000_01", save_path)
     
 
 def food_webs_Thompson_and_Townsend_2000_02(save_path='./data'):    
@@ -961,19 +689,7 @@ def food_webs_Thompson_and_Townsend_2000_02(save_path='./data'):
     
     
     """
-    url = 'http://www.web-of-life.es/networkjson.php?id=FW_015_02'
-    data_type = 'weboflife_foodwebs_json'
-    data_name = 'networkjson.php?id=FW_015_02'
-    compress_type = None
-    infos = {
-         'type': data_type,
-         'download_url' : url,
-        'info_url': 'http://www.web-of-life.es/map.php?type=7',
-        'source' :  'Thompson, R., Townsend, C. (2000) Is resolution the solution?: the effect of taxonomic resolution on the calculated properties of three stream food webs. Freshwater Biology  44, 413-422'
-    }
-
-    data = Dataset(url, save_path, data_type, data_name, compress_type, infos)
-    return data
+    return registry.dataset("food_webs_Thompson_and_Townsend_2000_02", save_path)
     
 
 def food_webs_Thompson_and_Townsend_2000_03(save_path='./data'):    
@@ -1002,19 +718,7 @@ def food_webs_Thompson_and_Townsend_2000_03(save_path='./data'):
     
     
     """
-    url = 'http://www.web-of-life.es/networkjson.php?id=FW_015_03'
-    data_type = 'weboflife_foodwebs_json'
-    data_name = 'networkjson.php?id=FW_015_03'
-    compress_type = None
-    infos = {
-         'type': data_type,
-         'download_url' : url,
-        'info_url': 'http://www.web-of-life.es/map.php?type=7',
-        'source' :  'Thompson, R., Townsend, C. (2000) Is resolution the solution?: the effect of taxonomic resolution on the calculated properties of three stream food webs. Freshwater Biology  44, 413-422'
-    }
-
-    data = Dataset(url, save_path, data_type, data_name, compress_type, infos)
-    return data
+    return registry.dataset("food_webs_Thompson_and_Townsend_2000_03", save_path)
     
 
 def food_webs_Thompson_and_Townsend_2000_04(save_path='./data'):    
@@ -1043,19 +747,7 @@ def food_webs_Thompson_and_Townsend_2000_04(save_path='./data'):
     
     
     """
-    url = 'http://www.web-of-life.es/networkjson.php?id=FW_015_04'
-    data_type = 'weboflife_foodwebs_json'
-    data_name = 'networkjson.php?id=FW_015_04'
-    compress_type = None
-    infos = {
-         'type': data_type,
-         'download_url' : url,
-        'info_url': 'http://www.web-of-life.es/map.php?type=7',
-        'source' :  'Thompson, R., Townsend, C. (2000) Is resolution the solution?: the effect of taxonomic resolution on the calculated properties of three stream food webs. Freshwater Biology  44, 413-422'
-    }
-
-    data = Dataset(url, save_path, data_type, data_name, compress_type, infos)
-    return data
+    return registry.dataset("food_webs_Thompson_and_Townsend_2000_04", save_path)
     
 
 def food_webs_Baeta_et_all_2011_01(save_path='./data'):    
@@ -1084,19 +776,7 @@ def food_webs_Baeta_et_all_2011_01(save_path='./data'):
     
     
     """
-    url = 'http://www.web-of-life.es/networkjson.php?id=FW_016_01'
-    data_type = 'weboflife_foodwebs_json'
-    data_name = 'networkjson.php?id=FW_016_01'
-    compress_type = None
-    infos = {
-         'type': data_type,
-         'download_url' : url,
-        'info_url': 'http://www.web-of-life.es/map.php?type=7',
-        'source' :  'Baeta, A. , Niquil, A., Marques, J. C., Patrício, J. (2011) Modelling the effects of eutrophication, mitigation measures and an extreme flood event on estuarine benthic food webs. Ecological Modelling 222, 1209–1221'
-    }
-
-    data = Dataset(url, save_path, data_type, data_name, compress_type, infos)
-    return data
+    return registry.dataset("food_webs_Baeta_et_all_2011_01", save_path)
     
 
 
@@ -1,10 +1,22 @@
 
-import networkx as nx
+import itertools
+import os
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
 import numpy as np
-import random as rdm
 
+from ..utils.rng import make_rng, spawn_seeds
+from ._fenwick import FenwickTree
+from ._edgelist import format_edges, check_return_type
+
+__all__ = [
+	'generalized_PA_model',
+	'generate_ensemble',
+]
 
-def generalized_PA_model(nu, p, N, directed=False, max_step=1e4):
+
+def generalized_PA_model(nu, p, N, directed=False, max_step=1e4, seed=None, return_type="networkx"):
 	"""Generates a network using the generalized preferential attachment model. The process goes as follows:
 
 		1. Initialize the network with two connected nodes.
@@ -32,9 +44,21 @@ def generalized_PA_model(nu, p, N, directed=False, max_step=1e4):
 	max_step : int : (default=1e4)
 		Maximum number of events before the algorithm ends. This does not apply if the desired number of nodes is reached.
 
+	seed : int, np.random.SeedSequence or np.random.Generator : (default=None)
+		Seed of the random number generator.
+
+	return_type : String : (default="networkx")
+		Type of the output. The edges are stored in preallocated arrays during the generation
+		and converted once at the end.
+
+		- ``"networkx"``: ``nx.Graph`` or ``nx.DiGraph``.
+		- ``"edgelist"``: ``np.array(M, 2)`` of the unique edges. Undirected edges appear once as ``(i, j)``
+		  with ``i <= j``, directed networks contain both orientations, as the ``nx.DiGraph``.
+		- ``"csr"``: ``scipy.sparse.csr_matrix`` binary adjacency matrix of shape ``(N, N)``.
+
 	**Returns**
 	
-	nx.Digraph or nx.Graph
+	nx.Digraph or nx.Graph, np.array(M, 2) or scipy.sparse.csr_matrix
 		The resulting graph.
 
 	**Raise**
@@ -58,6 +82,9 @@ def generalized_PA_model(nu, p, N, directed=False, max_step=1e4):
 		
 		See `Young et al., 2018 <https://arxiv.org/pdf/1803.09191.pdf>`_ for an intensive description of the model.
 
+		Existing nodes are sampled with a Fenwick tree of the weights ``k**nu`` (or from the list of edge
+		endpoints if ``nu==1``), so each event costs O(log N) and the generation is near-linear in ``N``.
+
 
 	
 	.. image:: /_static/assets/zoo.png
@@ -70,65 +97,166 @@ def generalized_PA_model(nu, p, N, directed=False, max_step=1e4):
 
 	"""
 
-	def add_edge(nodeA, nodeB, G, k, directed):
+	def add_edge(nodeA, nodeB, k):
+		nonlocal edges, n_edges
 		k[nodeA] += 1
 		k[nodeB] += 1
-		G.add_edge(nodeA, nodeB)
-		if directed: 
-			G.add_edge(nodeB, nodeA)
-
+		if n_edges == len(edges):
+			edges = np.concatenate([edges, np.empty_like(edges)])
+		edges[n_edges] = nodeA, nodeB
+		n_edges += 1
 
-	def choose_existing_node(degrees, nu, tot_k):
-		k_ch = rdm.random()*tot_k
-		for i, k in enumerate(degrees):
-			if k_ch-(k**nu)<=0.0:
-				return i
-			else:
-				k_ch -= (k**nu)
+	def random_numbers(rng):
+		# Uniform numbers drawn by blocks.
+		while True:
+			yield from rng.random(4096).tolist()
 
 
 
 	if p<=0:
 		raise ValueError("p must be larger than 0. ")
+	check_return_type(return_type)
+
+	random = random_numbers(make_rng(seed))
 
 	degrees = [0]*N
-	G = nx.DiGraph() if directed else nx.Graph()
+	# One edge per event, about N/p events are expected.
+	edges = np.empty((min(int(max_step), int(N/p)) + 1, 2), dtype=np.int64)
+	n_edges = 0
+
+	if nu == 1:
+		# Urn of edge endpoints: a uniform endpoint is a node chosen proportionally to its degree.
+		urn = []
+		def choose_existing_node():
+			return urn[int(next(random)*len(urn))]
+		def update_weights(nodeA, nodeB):
+			urn.append(nodeA)
+			urn.append(nodeB)
+	else:
+		# Weights k**nu of the existing nodes, updated in O(log N).
+		weights = FenwickTree(N)
+		def choose_existing_node():
+			return weights.sample(next(random))
+		def update_weights(nodeA, nodeB):
+			weights.update(nodeA, degrees[nodeA]**nu)
+			weights.update(nodeB, degrees[nodeB]**nu)
 
 	# Step 1. Initiate the network
-	add_edge(0, 1, G, degrees, directed)
+	add_edge(0, 1, degrees)
+	update_weights(0, 1)
 
 	n_nodes = 2
 	nodeB, nodeA = 0, 0
 
 	for t in range(int(max_step)):
 
-		tot_k = np.sum([k**nu for k in degrees[:n_nodes]])
-
-		if rdm.random()<p:
+		if next(random)<p:
 			nodeA = n_nodes
 			n_nodes += 1
 		else:
-			nodeA = choose_existing_node(degrees, nu, tot_k)
+			nodeA = choose_existing_node()
 
-		nodeB = choose_existing_node(degrees, nu, tot_k)
-		add_edge(nodeA, nodeB, G, degrees, directed)
+		nodeB = choose_existing_node()
+		add_edge(nodeA, nodeB, degrees)
+		update_weights(nodeA, nodeB)
 
 		if (n_nodes>=N):
-			return G
+			edges = edges[:n_edges]
+			if directed:
+				edges = np.concatenate([edges, edges[:, ::-1]])
+			return format_edges(edges, N, directed, return_type)
 
 	raise RuntimeWarning("Maximum number of steps reached")
-	return G
 
 
+def _generate_edges(index, nu, p, N, directed, max_step, seed):
+	return index, generalized_PA_model(nu, p, N, directed=directed, max_step=max_step, seed=seed, return_type="edgelist")
 
 
+def generate_ensemble(nu, p, N, n_graphs, n_jobs=None, directed=False, max_step=1e4, seed=None, path=None):
+	"""Generates many independent networks with ``generalized_PA_model`` in a pool of processes.
 
+	Each network gets its own child seed spawned from ``seed``, so the ensemble is reproducible
+	whatever the number of processes. Networks are returned as compact edge arrays (see
+	``return_type="edgelist"`` of ``generalized_PA_model``).
 
+	**Parameters**
 
+	nu : float
+		Kernel power.
 
+	p : float
+		Birth probability.
 
+	N : int
+		Number of nodes of each network.
 
+	n_graphs : int
+		Number of networks.
 
+	n_jobs : int : (default=None)
+		Number of processes. If None, the number of processors is used. If 1, the networks
+		are generated in the current process.
 
+	directed : bool : (default=False)
+		Construct directed networks.
+
+	max_step : int : (default=1e4)
+		Maximum number of events for each network.
+
+	seed : int, np.random.SeedSequence or np.random.Generator : (default=None)
+		Root seed of the ensemble.
 
+	path : String : (default=None)
+		If not None, each network is written to this ``.npz`` archive as soon as it is generated,
+		under the key ``"graph_<index>"``, and is not kept in memory.
 
+	**Returns**
+
+	list of np.array(M, 2) or String
+		Edges of each network, in the order of their seeds, or ``path`` if given.
+
+	**Example**
+
+	.. code:: python
+
+		import numpy as np
+		import dynamicalab as dlb
+
+		dlb.generate_ensemble(1.0, 0.5, 1000, n_graphs=100, seed=42, path="ensemble.npz")
+		with np.load("ensemble.npz") as archive:
+			edges = archive["graph_0"]
+
+	"""
+	tasks = [(index, nu, p, N, directed, max_step, task_seed)
+			 for index, task_seed in enumerate(spawn_seeds(seed, n_graphs))]
+
+	def generated():
+		if n_jobs == 1:
+			for task in tasks:
+				yield _generate_edges(*task)
+			return
+		# At most two tasks per process are submitted ahead, such that only a few finished
+		# networks wait in memory to be consumed, and each is dropped once yielded.
+		remaining = iter(tasks)
+		max_pending = 2*(n_jobs or os.cpu_count() or 1)
+		with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+			pending = {executor.submit(_generate_edges, *task) for task in itertools.islice(remaining, max_pending)}
+			while pending:
+				done, pending = wait(pending, return_when=FIRST_COMPLETED)
+				for task in itertools.islice(remaining, len(done)):
+					pending.add(executor.submit(_generate_edges, *task))
+				while done:
+					yield done.pop().result()
+
+	if path is None:
+		ensemble = [None]*n_graphs
+		for index, edges in generated():
+			ensemble[index] = edges
+		return ensemble
+
+	with zipfile.ZipFile(path, "w", allowZip64=True) as archive:
+		for index, edges in generated():
+			with archive.open("graph_%d.npy" % index, "w", force_zip64=True) as f:
+				np.lib.format.write_array(f, edges)
+	return path
@@ -0,0 +1,192 @@
+import numpy as np
+
+from ..utils.rng import make_rng
+from ._edgelist import format_edges, check_return_type
+
+__all__ = [
+	'configuration_model',
+	'stochastic_block_model',
+]
+
+
+def configuration_model(degree_sequence, selfloops=True, seed=None, return_type="networkx"):
+	"""Generates a network with a given degree sequence by random matching of the edge stubs.
+
+	All the stubs are shuffled at once and paired two by two, without any Python loop.
+
+	**Parameters**
+
+	degree_sequence : list of int
+		Degree of each node. The sum must be even.
+
+	selfloops : bool : (default=True)
+		If False, the self-loops created by the matching are removed.
+
+	seed : int, np.random.SeedSequence or np.random.Generator : (default=None)
+		Seed of the random number generator.
+
+	return_type : String : (default="networkx")
+		``"networkx"``, ``"edgelist"`` or ``"csr"``, see ``generalized_PA_model``.
+
+	**Returns**
+
+	nx.Graph, np.array(M, 2) or scipy.sparse.csr_matrix
+		The resulting graph. Multi-edges are merged, so the degrees can be slightly lower
+		than ``degree_sequence``.
+
+	**Raise**
+
+		``ValueError``
+			Occurs if the sum of the degrees is odd.
+
+	**Example**
+
+	.. code:: python
+
+		import numpy as np
+		import dynamicalab as dlb
+
+		degrees = np.random.zipf(2.5, size=10**6)
+		degrees[0] += degrees.sum() % 2
+		edges = dlb.configuration_model(degrees, return_type="edgelist")
+
+	"""
+	check_return_type(return_type)
+	degree_sequence = np.asarray(degree_sequence, dtype=np.int64)
+	if degree_sequence.sum() % 2 != 0:
+		raise ValueError("The sum of the degrees must be even.")
+
+	rng = make_rng(seed)
+	stubs = np.repeat(np.arange(len(degree_sequence)), degree_sequence)
+	edges = rng.permutation(stubs).reshape((-1, 2))
+	if not selfloops:
+		edges = edges[edges[:, 0] != edges[:, 1]]
+
+	return format_edges(edges, len(degree_sequence), False, return_type)
+
+
+def _geometric_skipping(n_pairs, p, rng):
+	"""Indices, in ``range(n_pairs)``, of the successes of ``n_pairs`` Bernoulli trials of probability ``p``.
+
+	The gaps between successes are geometric, so the cost is proportional to the
+	number of successes instead of the number of trials.
+	"""
+	if p <= 0 or n_pairs == 0:
+		return np.zeros(0, dtype=np.int64)
+	if p >= 1:
+		return np.arange(n_pairs, dtype=np.int64)
+
+	expected = n_pairs*p
+	positions = np.zeros(0, dtype=np.int64)
+	last = -1
+	while last < n_pairs:
+		gaps = rng.geometric(p, size=int(expected + 5*np.sqrt(expected) + 10))
+		new_positions = last + np.cumsum(gaps)
+		positions = np.concatenate([positions, new_positions])
+		last = new_positions[-1]
+	return positions[positions < n_pairs]
+
+
+def _upper_triangle_pairs(index, n):
+	"""Maps linear indices to the pairs ``(i, j)``, ``i < j < n``, in row-major order."""
+	def before(i):
+		return i*(2*n - i - 1)//2
+
+	i = np.floor((2*n - 1 - np.sqrt((2*n - 1)**2 - 8.0*index))/2).astype(np.int64)
+	# Corrects the rounding errors of the square root.
+	i[before(i + 1) <= index] += 1
+	i[before(i) > index] -= 1
+	j = index - before(i) + i + 1
+	return i, j
+
+
+def stochastic_block_model(sizes, probabilities, directed=False, selfloops=False, seed=None, return_type="networkx"):
+	"""Generates a network with the stochastic block model.
+
+	Nodes are split into consecutive blocks and each pair of nodes of blocks ``r`` and ``s`` is connected
+	with probability ``probabilities[r][s]``. The edges of each pair of blocks are drawn by geometric
+	skipping, in a time proportional to their number, which is efficient for sparse blocks.
+
+	**Parameters**
+
+	sizes : list of int
+		Number of nodes of each block. Block ``r`` holds the nodes ``sum(sizes[:r])`` to ``sum(sizes[:r+1])-1``.
+
+	probabilities : list of lists of float
+		Matrix of connection probabilities between blocks. It must be symmetric if ``directed`` is False.
+
+	directed : bool : (default=False)
+		Construct a directed network.
+
+	selfloops : bool : (default=False)
+		Allow self-loops, with the probability of the diagonal blocks.
+
+	seed : int, np.random.SeedSequence or np.random.Generator : (default=None)
+		Seed of the random number generator.
+
+	return_type : String : (default="networkx")
+		``"networkx"``, ``"edgelist"`` or ``"csr"``, see ``generalized_PA_model``.
+
+	**Returns**
+
+	nx.Graph or nx.DiGraph, np.array(M, 2) or scipy.sparse.csr_matrix
+		The resulting graph.
+
+	**Raise**
+
+		``ValueError``
+			Occurs if ``probabilities`` is not a square matrix matching ``sizes``, or is not symmetric for an undirected network.
+
+	**Example**
+
+	.. code:: python
+
+		import numpy as np
+		import dynamicalab as dlb
+		import dynamicalab.drawing as draw
+
+		sizes = [50, 50, 100]
+		probabilities = [[0.2, 0.01, 0.01], [0.01, 0.2, 0.01], [0.01, 0.01, 0.1]]
+		G = dlb.stochastic_block_model(sizes, probabilities)
+
+		groups = np.split(np.arange(sum(sizes)), np.cumsum(sizes)[:-1])
+		pos, edges = draw.clustered_layout(G, groups, [[0, 0], [3, 0], [1.5, 3]])
+
+	"""
+	check_return_type(return_type)
+	sizes = np.asarray(sizes, dtype=np.int64)
+	probabilities = np.asarray(probabilities, dtype=np.float64)
+	if probabilities.shape != (len(sizes), len(sizes)):
+		raise ValueError("probabilities must be a square matrix with one row per block.")
+	if not directed and not np.allclose(probabilities, probabilities.T):
+		raise ValueError("probabilities must be symmetric for an undirected network.")
+
+	rng = make_rng(seed)
+	offsets = np.concatenate([[0], np.cumsum(sizes)])
+	edges = []
+	for r in range(len(sizes)):
+		for s in range(len(sizes)):
+			n_r, n_s = sizes[r], sizes[s]
+			if r != s:
+				if not directed and s < r:
+					continue
+				index = _geometric_skipping(n_r*n_s, probabilities[r, s], rng)
+				i, j = index // n_s, index % n_s
+			elif directed:
+				n_cols = n_r if selfloops else n_r - 1
+				index = _geometric_skipping(n_r*n_cols, probabilities[r, r], rng)
+				i, j = index // max(n_cols, 1), index % max(n_cols, 1)
+				if not selfloops:
+					j = j + (j >= i)
+			elif selfloops:
+				# Pairs i <= j of n nodes are the pairs i < j+1 of n+1 nodes.
+				index = _geometric_skipping(n_r*(n_r + 1)//2, probabilities[r, r], rng)
+				i, j = _upper_triangle_pairs(index, n_r + 1)
+				j = j - 1
+			else:
+				index = _geometric_skipping(n_r*(n_r - 1)//2, probabilities[r, r], rng)
+				i, j = _upper_triangle_pairs(index, n_r)
+			edges.append(np.column_stack([offsets[r] + i, offsets[s] + j]))
+
+	edges = np.concatenate(edges) if edges else np.zeros((0, 2), dtype=np.int64)
+	return format_edges(edges, int(offsets[-1]), directed, return_type)
@@ -0,0 +1,100 @@
+import random
+
+import networkx as nx
+import numpy as np
+
+import dynamicalab as dl
+from dynamicalab.generators._fenwick import FenwickTree
+
+
+def _tree(weights):
+	tree = FenwickTree(len(weights))
+	for i, weight in enumerate(weights):
+		tree.update(i, weight)
+	return tree
+
+
+def test_sample_frequencies():
+	# Zero weights in the middle and at both ends.
+	weights = [0, 3, 0, 0, 1, 0.5, 0, 6, 0, 0, 2.5, 0, 0]
+	tree = _tree(weights)
+	assert tree.total == sum(weights)
+
+	n_samples = 200000
+	rng = random.Random(1)
+	counts = np.bincount([tree.sample(rng.random()) for _ in range(n_samples)], minlength=len(weights))
+	expected = np.array(weights)/sum(weights)
+	assert np.all(counts[expected == 0] == 0)
+	assert np.abs(counts/n_samples - expected).max() < 0.005
+
+
+def test_find_skips_zero_weights():
+	weights = [0, 3, 0, 0, 1, 0.5, 0, 6, 0, 0, 2.5, 0, 0]
+	tree = _tree(weights)
+	cumulative = np.cumsum(weights)
+	for u in np.concatenate([cumulative, cumulative[1:] - 1e-9, [0, tree.total, 2*tree.total]]):
+		i = tree.find(u)
+		assert weights[i] > 0
+		if 0 <= u < tree.total:
+			assert cumulative[i] > u and (i == 0 or cumulative[i - 1] <= u)
+	# Uniform numbers close to 1 stay on the last nonzero weight, whatever the rounding of the sums.
+	assert tree.sample(np.nextafter(1.0, 0.0)) == 10
+
+	tree.update(10, 0)
+	tree.update(1, 0)
+	assert tree.sample(np.nextafter(1.0, 0.0)) == 7
+	assert tree.sample(0.0) == 4
+
+
+def test_rounding_errors():
+	tree = _tree([0.1]*7 + [0.0]*9)
+	for i in range(7):
+		tree.update(i, 0.1*(i + 1))
+		tree.update(i, 0.1)
+	for u in np.linspace(0, 1, 1001)[:-1]:
+		assert tree.sample(u) < 7
+	assert tree.sample(np.nextafter(1.0, 0.0)) == 6
+
+
+def _linear_scan_PA_model(nu, p, N, rng):
+	"""First implementation of ``generalized_PA_model``, sampling the nodes by a linear scan of the degrees."""
+	def choose_existing_node(degrees, tot_k):
+		k_ch = rng.random()*tot_k
+		for i, k in enumerate(degrees):
+			if k_ch - (k**nu) <= 0.0:
+				return i
+			k_ch -= (k**nu)
+
+	degrees = [0]*N
+	G = nx.Graph()
+	degrees[0] = degrees[1] = 1
+	G.add_edge(0, 1)
+	n_nodes = 2
+	while n_nodes < N:
+		tot_k = sum(k**nu for k in degrees[:n_nodes])
+		if rng.random() < p:
+			nodeA = n_nodes
+			n_nodes += 1
+		else:
+			nodeA = choose_existing_node(degrees, tot_k)
+		nodeB = choose_existing_node(degrees, tot_k)
+		degrees[nodeA] += 1
+		degrees[nodeB] += 1
+		G.add_edge(nodeA, nodeB)
+	return G
+
+
+def _max_degrees(graphs):
+	return np.array([max(d for _, d in G.degree()) for G in graphs])
+
+
+def test_generalized_PA_model_degrees():
+	N, p, n_graphs = 100, 0.5, 400
+	for nu in (1.0, 1.3):
+		rng = random.Random(2)
+		reference = _max_degrees(_linear_scan_PA_model(nu, p, N, rng) for _ in range(n_graphs))
+		generated = _max_degrees(dl.generalized_PA_model(nu, p, N, seed=seed) for seed in range(n_graphs))
+		# Difference of the means within four standard errors.
+		error = np.sqrt((reference.var() + generated.var())/n_graphs)
+		assert abs(reference.mean() - generated.mean()) < 4*error, (nu, reference.mean(), generated.mean())
+		assert abs(np.median(reference) - np.median(generated)) <= 0.15*np.median(reference), nu
@@ -0,0 +1,79 @@
+import itertools
+
+import numpy as np
+
+import dynamicalab as dl
+from dynamicalab.generators.random_graphs import _upper_triangle_pairs
+
+
+def test_upper_triangle_pairs():
+	for n in range(2, 60):
+		pairs = np.array(list(itertools.combinations(range(n), 2)))
+		i, j = _upper_triangle_pairs(np.arange(len(pairs), dtype=np.int64), n)
+		assert np.array_equal(np.column_stack([i, j]), pairs), n
+
+
+def _block_densities(A, sizes, directed, selfloops):
+	"""Returns the fraction of the possible edges present between each pair of blocks."""
+	offsets = np.concatenate([[0], np.cumsum(sizes)])
+	densities = np.zeros((len(sizes), len(sizes)))
+	for r in range(len(sizes)):
+		for s in range(len(sizes)):
+			block = A[offsets[r]:offsets[r + 1], offsets[s]:offsets[s + 1]]
+			if r != s:
+				densities[r, s] = block.sum()/block.size
+			elif directed:
+				n_pairs = sizes[r]**2 if selfloops else sizes[r]*(sizes[r] - 1)
+				densities[r, s] = block.sum()/n_pairs
+			else:
+				upper = np.triu(block, 0 if selfloops else 1)
+				densities[r, s] = upper.sum()/(sizes[r]*(sizes[r] + 1 if selfloops else sizes[r] - 1)/2)
+	return densities
+
+
+def test_stochastic_block_model():
+	sizes = [40, 3, 25, 60]
+	probabilities = np.array([[0.3, 0.05, 0.1, 0.0],
+							  [0.05, 0.5, 0.2, 0.02],
+							  [0.1, 0.2, 0.6, 0.05],
+							  [0.0, 0.02, 0.05, 0.15]])
+	n_graphs = 60
+	for directed, selfloops in itertools.product([False, True], repeat=2):
+		# Asymmetric probabilities for the directed networks.
+		P = probabilities + 0.5*np.triu(probabilities, 1) if directed else probabilities
+		densities = np.zeros(P.shape)
+		diagonal = 0
+		for seed in range(n_graphs):
+			A = dl.stochastic_block_model(sizes, P, directed=directed, selfloops=selfloops, seed=seed,
+										  return_type="csr").toarray()
+			assert A.max() <= 1
+			if not directed:
+				assert np.array_equal(A, A.T)
+			diagonal += np.trace(A)
+			densities += _block_densities(A, sizes, directed, selfloops)
+		densities /= n_graphs
+
+		if not selfloops:
+			assert diagonal == 0, (directed, selfloops)
+		else:
+			assert diagonal > 0, (directed, selfloops)
+		assert np.array_equal(densities == 0, P == 0), (directed, selfloops)
+		assert np.abs(densities - P).max() < 0.03, (directed, selfloops, densities)
+
+
+def test_stochastic_block_model_diagonal_pairs():
+	# Every pair of a complete block appears exactly once, with the self-loops if requested.
+	for directed, selfloops in itertools.product([False, True], repeat=2):
+		A = dl.stochastic_block_model([7, 5], [[1, 0], [0, 1]], directed=directed, selfloops=selfloops,
+									  seed=0, return_type="csr").toarray()
+		expected = np.zeros((12, 12), dtype=A.dtype)
+		expected[:7, :7] = expected[7:, 7:] = 1
+		if not selfloops:
+			np.fill_diagonal(expected, 0)
+		assert np.array_equal(A, expected), (directed, selfloops)
+		edges = dl.stochastic_block_model([7, 5], [[1, 0], [0, 1]], directed=directed, selfloops=selfloops,
+										  seed=0, return_type="edgelist")
+		n_pairs = 7*7 + 5*5 if directed else 7*8//2 + 5*6//2
+		if not selfloops:
+			n_pairs -= 12
+		assert len(edges) == n_pairs, (directed, selfloops)
@@ -1,2 +1,3 @@
 
-from .preprocessing import *
\ No newline at end of file
+from .preprocessing import *
+from .rng import *
\ No newline at end of file
@@ -34,13 +34,18 @@ def merge_duplicated_nodes(G, based_on="name", get_node_attr_fct=None, relabel=F
 	"""Merge duplicated nodes based on either a key attribute (`based_on`)
 	or using a certain function to extract the node key.
 
+	Nodes are grouped by key with a hash map and every group is merged into its first node, which keeps
+	the attributes of the others in ``"contraction"``, as ``nx.contracted_nodes``. The edges are remapped
+	and the graph is rebuilt once, in linear time.
+
 	**Parameters**
 
 	G : nx.Graph
 		Networkx graph
 
 	based_on : String
-		If not None, will be used to extract node identity as ``node["attr_dict"][based_on]``.
+		If not None, will be used to extract node identity as ``node["attr_dict"][based_on]``, or from the
+		column ``based_on`` of ``G.graph["node_table"]`` if the graph has a node table.
 		If None, the ``get_node_attr_fct`` will be used.
 	
 	get_node_attr_fct : method
@@ -60,15 +65,46 @@ def merge_duplicated_nodes(G, based_on="name", get_node_attr_fct=None, relabel=F
 		if get_node_attr_fct is None:
 			raise KeyError("Parameter get_node_attr_fct must be defined.")
 
-		u = np.array([get_node_attr_fct(node) for i,node in G.nodes(data=True)])
+		keys = [get_node_attr_fct(node) for i,node in G.nodes(data=True)]
+	elif "node_table" in G.graph:
+		keys = G.graph["node_table"].get(based_on, [None]*G.number_of_nodes())
+		if len(keys) != G.number_of_nodes():
+			raise ValueError("The node table must have one row per node.")
+		# A field missing in a node is None in the table, it must not merge all such nodes together.
+		if None in keys:
+			raise KeyError("Node {} has no attribute {}.".format(list(G.nodes())[keys.index(None)], based_on))
+	else:
+		keys = [node["attr_dict"][based_on] for i,node in G.nodes(data=True)]
+
+	# Each node is relabeled to the first node with the same key.
+	nodes = list(G.nodes())
+	first = {}
+	relabeling = np.array([first.setdefault(key, i) for i, key in enumerate(keys)], dtype=np.int64)
+	kept = np.flatnonzero(relabeling == np.arange(len(nodes)))
+
+	H = G.__class__()
+	H.graph.update(G.graph)
+	H.add_nodes_from((nodes[i], G.nodes[nodes[i]]) for i in kept.tolist())
+	for i in np.flatnonzero(relabeling != np.arange(len(nodes))).tolist():
+		H.nodes[nodes[relabeling[i]]].setdefault("contraction", {})[nodes[i]] = dict(G.nodes[nodes[i]])
+
+	# Edges are remapped at once, the self-loops between merged nodes are kept.
+	index = {node: i for i, node in enumerate(nodes)}
+	edge_data = list(G.edges(data=True))
+	edges = relabeling[np.array([(index[a], index[b]) for a, b, _ in edge_data], dtype=np.int64).reshape((-1, 2))]
+	if any(data for _, _, data in edge_data):
+		H.add_edges_from((nodes[a], nodes[b], data) for (a, b), (_, _, data) in zip(edges.tolist(), edge_data))
 	else:
-		u = np.array([node["attr_dict"][based_on] for i,node in G.nodes(data=True)])
+		if not G.is_directed():
+			edges.sort(axis=1)
+		# Duplicated edges are dropped, keeping the order of first appearance.
+		_, first_edges = np.unique(edges, axis=0, return_index=True)
+		H.add_edges_from((nodes[a], nodes[b]) for a, b in edges[np.sort(first_edges)].tolist())
+
+	if "node_table" in G.graph:
+		H.graph["node_table"] = {field: [values[i] for i in kept.tolist()] for field, values in G.graph["node_table"].items()}
+	G = H
 
-	for unique_node in np.unique(u):
-		v = np.argwhere(np.array(u)==unique_node)
-		if len(v)>1:
-			for k in range(len(v)-1):
-				G = nx.contracted_nodes(G, int(v[0]), int(v[k+1]))
 	if relabel:
 		mapping = {}
 		for i,node in enumerate(G.nodes()):
@@ -0,0 +1,51 @@
+import numpy as np
+
+__all__ = [
+	'make_rng',
+	'spawn_seeds',
+]
+
+
+def make_rng(seed=None):
+	"""Random number generator built from a seed.
+
+	**Parameters**
+
+	seed : None, int, np.random.SeedSequence or np.random.Generator
+		Seed of the generator. A ``Generator`` is returned as is, so that
+		a stream can be shared by several objects.
+
+	**Returns**
+
+	np.random.Generator
+
+	"""
+	if isinstance(seed, np.random.Generator):
+		return seed
+	return np.random.default_rng(seed)
+
+
+def spawn_seeds(seed, n):
+	"""Spawns ``n`` independent child seeds with ``np.random.SeedSequence``.
+
+	The children only depend on ``seed`` and on their index, so parallel tasks
+	seeded with them are reproducible and statistically independent.
+
+	**Parameters**
+
+	seed : None, int, np.random.SeedSequence or np.random.Generator
+		Root seed. The children of a ``Generator`` are drawn from its stream.
+
+	n : int
+		Number of child seeds.
+
+	**Returns**
+
+	list of np.random.SeedSequence
+
+	"""
+	if isinstance(seed, np.random.Generator):
+		seed = np.random.SeedSequence(seed.integers(2**63, size=4))
+	elif not isinstance(seed, np.random.SeedSequence):
+		seed = np.random.SeedSequence(seed)
+	return seed.spawn(n)
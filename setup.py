@@ -51,6 +51,7 @@ if __name__ == "__main__":
         author_email="edward.laurence.1@ulaval.ca",
         description="Python module to study complex networks",
         packages=packages,
+        package_data={"dynamicalab.classes": ["datasets.json"]},
         extras_require=extras_require
     )
 